@@ -7,6 +7,7 @@ Usage:
 """
 
 import argparse
+import contextlib
 import json
 import sys
 import time
@@ -14,6 +15,11 @@ from pathlib import Path
 
 import numpy as np
 
+try:
+    import orjson  # C-level JSON with native numpy support
+except ImportError:
+    orjson = None
+
 from generator import QuoteGenerator
 
 
@@ -31,17 +37,93 @@ class NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def dumps_line(obj) -> bytes:
+    """Serialize one record to newline-terminated JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, cls=NumpyEncoder) + "\n").encode()
+
+
+def dumps_doc(obj, pretty: bool = False) -> bytes:
+    """Serialize a whole document (array or single record) to JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+    indent = 2 if pretty else None
+    return json.dumps(obj, indent=indent, ensure_ascii=False, cls=NumpyEncoder).encode()
+
+
+@contextlib.contextmanager
+def open_output(path: Path):
+    """Open `path` for buffered binary writing, compressing transparently
+    when the name ends in .zst (e.g. quotes.jsonl.zst)."""
+    with open(path, "wb", buffering=1 << 20) as f:
+        if path.suffix == ".zst":
+            import zstandard as zstd
+            # threads=-1: one compression thread per core, overlapping the writes
+            with zstd.ZstdCompressor(level=3, threads=-1).stream_writer(f) as writer:
+                yield writer
+        else:
+            yield f
+
+
+def _generate_chunk(seed: np.random.SeedSequence, size: int, counter_start: int) -> bytes:
+    """Worker: generate `size` quotes and return them as encoded jsonl bytes."""
+    gen = QuoteGenerator(seed=seed)
+    gen._quote_counter = counter_start  # keep quote IDs unique across workers
+    buf = bytearray()
+    for chunk in gen.generate_iter(size):
+        for q in chunk:
+            buf += dumps_line(q)
+    return bytes(buf)
+
+
+def _generate_parallel(args, out_path: Path) -> None:
+    """Generate across processes, each with an independent SeedSequence stream."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = args.jobs
+    ss = np.random.SeedSequence(args.seed)
+    seeds = ss.spawn(jobs)
+    sizes = [args.n // jobs + (1 if i < args.n % jobs else 0) for i in range(jobs)]
+    offsets = [sum(sizes[:i]) for i in range(jobs)]
+
+    with ProcessPoolExecutor(max_workers=jobs) as ex, open_output(out_path) as f:
+        futures = [ex.submit(_generate_chunk, seeds[i], sizes[i], offsets[i])
+                   for i in range(jobs) if sizes[i] > 0]
+        for fut in futures:  # in submission order so output is deterministic
+            f.write(fut.result())
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate synthetic motor insurance quotes")
     parser.add_argument("--n", type=int, default=10, help="Number of quotes to generate")
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
     parser.add_argument("--output", type=str, default=None,
-                        help="Output file path (.jsonl or .json). Prints to stdout if not specified.")
+                        help="Output file path (.jsonl, .json or .jsonl.zst). Prints to stdout if not specified.")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
     parser.add_argument("--format", choices=["jsonl", "json"], default="jsonl",
                         help="Output format: jsonl (one JSON per line) or json (single array)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for jsonl file output (default: 1)")
     args = parser.parse_args()
 
+    if args.jobs > 1 and args.output and args.format == "jsonl" \
+            and Path(args.output).suffix != ".json":
+        out_path = Path(args.output)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        print(f"Generating {args.n} quotes across {args.jobs} processes...", file=sys.stderr)
+        t1 = time.time()
+        _generate_parallel(args, out_path)
+        gen_time = time.time() - t1
+        print(f"  Generated in {gen_time:.1f}s ({args.n / gen_time:.0f} quotes/sec)", file=sys.stderr)
+        size_kb = out_path.stat().st_size / 1024
+        print(f"  Saved: {out_path} ({size_kb:.1f} KB)", file=sys.stderr)
+        return
+    if args.jobs > 1:
+        print("  Note: --jobs applies only to jsonl file output; running single-process",
+              file=sys.stderr)
+
     print(f"Loading distribution data...", file=sys.stderr)
     t0 = time.time()
     gen = QuoteGenerator(seed=args.seed)
@@ -50,33 +132,50 @@ def main():
 
     print(f"Generating {args.n} quotes...", file=sys.stderr)
     t1 = time.time()
-    quotes = gen.generate(args.n)
-    gen_time = time.time() - t1
-    print(f"  Generated in {gen_time:.1f}s ({args.n / gen_time:.0f} quotes/sec)", file=sys.stderr)
-
-    # Output
-    indent = 2 if args.pretty else None
 
     if args.output:
+        # Stream quotes to disk in chunks — constant memory, writes
+        # overlap generation instead of waiting for the full list.
         out_path = Path(args.output)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if args.format == "json" or out_path.suffix == ".json":
-            with open(out_path, "w") as f:
-                json.dump(quotes, f, indent=indent, ensure_ascii=False, cls=NumpyEncoder)
-        else:
-            with open(out_path, "w") as f:
-                for q in quotes:
-                    f.write(json.dumps(q, ensure_ascii=False, cls=NumpyEncoder) + "\n")
-
+        as_array = args.format == "json" or out_path.suffix == ".json"
+
+        with open_output(out_path) as f:
+            if as_array and args.pretty:
+                # Pretty array needs the whole document in one piece
+                f.write(dumps_doc(gen.generate(args.n), pretty=True))
+            elif as_array:
+                f.write(b"[")
+                first = True
+                for chunk in gen.generate_iter(args.n):
+                    for q in chunk:
+                        if not first:
+                            f.write(b",")
+                        f.write(dumps_doc(q))
+                        first = False
+                f.write(b"]")
+            else:
+                for chunk in gen.generate_iter(args.n):
+                    # One large write per chunk beats thousands of small ones
+                    buf = bytearray()
+                    for q in chunk:
+                        buf += dumps_line(q)
+                    f.write(buf)
+
+        gen_time = time.time() - t1
+        print(f"  Generated in {gen_time:.1f}s ({args.n / gen_time:.0f} quotes/sec)", file=sys.stderr)
         size_kb = out_path.stat().st_size / 1024
         print(f"  Saved: {out_path} ({size_kb:.1f} KB)", file=sys.stderr)
     else:
+        quotes = gen.generate(args.n)
+        gen_time = time.time() - t1
+        print(f"  Generated in {gen_time:.1f}s ({args.n / gen_time:.0f} quotes/sec)", file=sys.stderr)
+
         if args.format == "json" or args.pretty:
-            print(json.dumps(quotes if args.n > 1 else quotes[0], indent=indent, ensure_ascii=False, cls=NumpyEncoder))
+            doc = quotes if args.n > 1 else quotes[0]
+            print(dumps_doc(doc, pretty=args.pretty).decode())
         else:
-            for q in quotes:
-                print(json.dumps(q, ensure_ascii=False, cls=NumpyEncoder))
+            sys.stdout.buffer.writelines(dumps_line(q) for q in quotes)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
 """Shared constants, lookup tables, and assumption-based distributions."""
 
+import sys
+
+import numpy as np
+
 # ── Channel distribution (aggregator market shares) ──────────────────────────
 CHANNEL_WEIGHTS = {
     "compare_the_market": 0.30,
@@ -100,14 +104,21 @@ UK_SURNAMES = [
     "Arnold", "Booth", "Hardy", "Newton", "Lloyd", "Warner", "Nicholson", "Parsons",
 ]
 
+# Order-preserving dedupe — "Walsh" appeared in both the English and Irish
+# blocks above, which silently double-weighted it under the Zipf decay
+UK_SURNAMES = [sys.intern(s) for s in dict.fromkeys(UK_SURNAMES)]
+
+# Object array so fancy-indexing with searchsorted results returns names directly
+UK_SURNAMES = np.array(UK_SURNAMES, dtype=object)
+
 # Surname weights: roughly Zipf-like decay
 _n = len(UK_SURNAMES)
-UK_SURNAME_WEIGHTS = [1.0 / (i + 1) ** 0.6 for i in range(_n)]
-_sw_total = sum(UK_SURNAME_WEIGHTS)
-UK_SURNAME_WEIGHTS = [w / _sw_total for w in UK_SURNAME_WEIGHTS]
+_sw = 1.0 / (np.arange(1, _n + 1, dtype=np.float64) ** 0.6)
+UK_SURNAME_WEIGHTS = _sw / _sw.sum()
+UK_SURNAME_CDF = np.cumsum(UK_SURNAME_WEIGHTS)
 
 # ── Common UK street names ───────────────────────────────────────────────────
-UK_STREET_NAMES = [
+UK_STREET_NAMES = (
     "High Street", "Station Road", "Church Lane", "Park Road", "Victoria Road",
     "Manor Road", "Church Street", "London Road", "Green Lane", "The Crescent",
     "Mill Lane", "Springfield Road", "King Street", "Queen Street", "New Road",
@@ -118,7 +129,7 @@ UK_STREET_NAMES = [
     "Chapel Lane", "Orchard Road", "Hillside", "The Green", "Brookside",
     "Rosemary Lane", "Primrose Drive", "Lavender Close", "Hawthorn Avenue", "Poplar Road",
     "Sycamore Drive", "Holly Close", "Ivy Lane", "Jasmine Court", "Heather Way",
-]
+)
 
 # ── Previous insurer market shares ───────────────────────────────────────────
 PREVIOUS_INSURERS = {
@@ -285,35 +296,98 @@ REGION_CITIES = {
     "Northern Ireland": ["Belfast", "Derry", "Lisburn", "Newry", "Bangor"],
 }
 
+# ── Precomputed cumulative-probability tables ────────────────────────────────
+# Every {option: weight} dict above is sampled per-quote; rebuilding and
+# re-normalising a probability array on each draw is wasted work. Prepare
+# (keys, cdf) pairs once at import time and sample with a single searchsorted.
+
+def prep_cdf(weights: dict) -> tuple[tuple, "np.ndarray"]:
+    """Turn an {option: weight} dict into a (keys, cumulative_probs) pair.
+
+    String options are sys.intern'd so every quote holds the same string
+    object rather than a fresh copy — less refcount churn and faster
+    dict/serializer hashing for the millions of draws a big run makes.
+    """
+    keys = tuple(sys.intern(k) if isinstance(k, str) else k for k in weights)
+    w = np.fromiter(weights.values(), dtype=np.float64)
+    return keys, np.cumsum(w / w.sum())
+
+
+def sample_cat(rng: "np.random.Generator", cdf: tuple):
+    """Draw one option from a (keys, cumulative_probs) pair."""
+    keys, cum = cdf
+    return keys[np.searchsorted(cum, rng.random())]
+
+
+CHANNEL_CDF = prep_cdf(CHANNEL_WEIGHTS)
+COVER_TYPE_CDF = prep_cdf(COVER_TYPE_WEIGHTS)
+PAYMENT_FREQ_CDF = prep_cdf(PAYMENT_FREQ_WEIGHTS)
+TITLE_CDF = {k: prep_cdf(v) for k, v in TITLE_WEIGHTS.items()}
+PREVIOUS_INSURER_CDF = prep_cdf(PREVIOUS_INSURERS)
+CONVICTION_CODE_CDF = prep_cdf(CONVICTION_CODE_WEIGHTS)
+CLAIM_TYPE_CDF = prep_cdf(CLAIM_TYPE_WEIGHTS)
+FAULT_CDF_BY_TYPE = {k: prep_cdf(v) for k, v in FAULT_WEIGHTS_BY_TYPE.items()}
+BREAKDOWN_LEVELS_CDF = prep_cdf(BREAKDOWN_LEVELS)
+BODY_TYPE_DOORS_CDF = {k: prep_cdf(v) for k, v in BODY_TYPE_DOORS.items()}
+BODY_TYPE_SEATS_CDF = {k: prep_cdf(v) for k, v in BODY_TYPE_SEATS.items()}
+OVERNIGHT_URBAN_CDF = prep_cdf(OVERNIGHT_URBAN)
+OVERNIGHT_RURAL_CDF = prep_cdf(OVERNIGHT_RURAL)
+DAYTIME_COMMUTING_CDF = prep_cdf(DAYTIME_COMMUTING)
+DAYTIME_NO_COMMUTING_CDF = prep_cdf(DAYTIME_NO_COMMUTING)
+EMPLOYMENT_CDF_BY_AGE = {k: prep_cdf(v) for k, v in EMPLOYMENT_BY_AGE.items()}
+
+
+# ── Age-band tables as sorted edge arrays ────────────────────────────────────
+# The {(min, max): value} dicts above need a Python loop per lookup.
+# Re-shape each into (sorted_lower_edges, values) so a band lookup is one
+# searchsorted — and vectorizes over arrays of ages for free.
+
+def _band_table(brackets: dict) -> tuple[np.ndarray, list]:
+    """Turn a {(min, max): value} dict into (lower_edges, values), sorted."""
+    items = sorted(brackets.items())
+    edges = np.array([lo for (lo, _hi), _v in items])
+    values = [v for _k, v in items]
+    return edges, values
+
+
+def lookup_band(table: tuple, age) -> object:
+    """Look up the band value for an age; clamps outside the covered range."""
+    edges, values = table
+    idx = int(np.searchsorted(edges, age, side="right")) - 1
+    return values[min(max(idx, 0), len(values) - 1)]
+
+
+EMPLOYMENT_CDF_BANDS = _band_table(EMPLOYMENT_CDF_BY_AGE)
+HOMEOWNER_RATE_BANDS = _band_table(HOMEOWNER_RATE_BY_AGE)
+MEDICAL_RATE_BANDS = _band_table(MEDICAL_RATE_BY_AGE)
+ALARM_RATE_BANDS = _band_table(SECURITY_FACTORY_ALARM_RATE)
+IMMOBILISER_RATE_BANDS = _band_table(SECURITY_FACTORY_IMMOBILISER_RATE)
+
+
 # ── Insurance group rough estimates by vehicle value band ────────────────────
+_INS_GROUP_VALUE_BINS = np.array([5000, 10000, 15000, 20000, 30000, 40000, 50000])
+_INS_GROUP_BASES = np.array([6, 12, 18, 22, 28, 33, 38, 43])
+_EV_FUELS = np.array(["electric", "plug_in_hybrid"])
+
+
+def estimate_insurance_group_vec(values, engine_ccs, fuels) -> np.ndarray:
+    """Vectorized insurance group 1-50 based on value + engine + fuel.
+
+    `engine_ccs` may contain 0/NaN for electric vehicles (no adjustment).
+    """
+    values = np.asarray(values)
+    engine_ccs = np.nan_to_num(np.asarray(engine_ccs, dtype=float))
+    fuels = np.asarray(fuels)
+
+    base = _INS_GROUP_BASES[np.digitize(values, _INS_GROUP_VALUE_BINS)]
+    base = base + np.where(engine_ccs > 2000, 3, np.where(engine_ccs > 1500, 1, 0))
+    ev_mask = np.isin(fuels, _EV_FUELS)
+    base = np.where(ev_mask, np.maximum(base - 3, 1), base)
+    return np.clip(base, 1, 50)
+
+
 def estimate_insurance_group(value: int, engine_cc: int | None, fuel: str) -> int:
     """Rough insurance group 1-50 based on value + engine + fuel."""
-    base = 1
-    if value < 5000:
-        base = 6
-    elif value < 10000:
-        base = 12
-    elif value < 15000:
-        base = 18
-    elif value < 20000:
-        base = 22
-    elif value < 30000:
-        base = 28
-    elif value < 40000:
-        base = 33
-    elif value < 50000:
-        base = 38
-    else:
-        base = 43
-
-    # Engine size adjustment
-    if engine_cc and engine_cc > 2000:
-        base += 3
-    elif engine_cc and engine_cc > 1500:
-        base += 1
-
-    # EV typically lower group
-    if fuel in ("electric", "plug_in_hybrid"):
-        base = max(base - 3, 1)
-
-    return min(max(base, 1), 50)
+    return int(estimate_insurance_group_vec(
+        np.array([value]), np.array([engine_cc or 0]), np.array([fuel])
+    )[0])
@@ -13,25 +13,116 @@ import numpy as np
 
 from generator.data_loader import DistributionData
 from generator.constants import (
-    ADDON_RATES, AGGREGATOR_CHANNELS, AGGREGATOR_PREFIX, BODY_TYPE_DOORS,
-    BODY_TYPE_SEATS, BREAKDOWN_LEVELS, CHANNEL_WEIGHTS, CLAIM_AMOUNT_BY_TYPE,
-    CLAIM_TYPE_WEIGHTS, CONVICTION_CODE_WEIGHTS, CONVICTION_CODES,
-    COVER_TYPE_WEIGHTS, DAYTIME_COMMUTING, DAYTIME_NO_COMMUTING,
-    EMPLOYMENT_BY_AGE, FAULT_WEIGHTS_BY_TYPE, HOMEOWNER_RATE_BY_AGE,
-    MEDICAL_RATE_BY_AGE, MODIFICATION_TYPES, OVERNIGHT_RURAL, OVERNIGHT_URBAN,
-    PAYMENT_FREQ_WEIGHTS, PREVIOUS_INSURERS, REGION_CITIES,
-    SECURITY_FACTORY_ALARM_RATE, SECURITY_FACTORY_IMMOBILISER_RATE,
-    TITLE_WEIGHTS, UK_STREET_NAMES, UK_SURNAME_WEIGHTS, UK_SURNAMES,
+    ADDON_RATES, AGGREGATOR_CHANNELS, AGGREGATOR_PREFIX,
+    BODY_TYPE_DOORS_CDF, BODY_TYPE_SEATS_CDF, BREAKDOWN_LEVELS_CDF,
+    CHANNEL_CDF, CLAIM_AMOUNT_BY_TYPE, CLAIM_TYPE_CDF,
+    CONVICTION_CODE_CDF, CONVICTION_CODES, COVER_TYPE_WEIGHTS,
+    DAYTIME_COMMUTING_CDF, DAYTIME_NO_COMMUTING_CDF,
+    ALARM_RATE_BANDS, EMPLOYMENT_CDF_BANDS, FAULT_CDF_BY_TYPE,
+    HOMEOWNER_RATE_BANDS, IMMOBILISER_RATE_BANDS, MEDICAL_RATE_BANDS,
+    MODIFICATION_TYPES, OVERNIGHT_RURAL_CDF, OVERNIGHT_URBAN_CDF,
+    PAYMENT_FREQ_WEIGHTS, PREVIOUS_INSURER_CDF, REGION_CITIES, TITLE_CDF,
+    UK_STREET_NAMES, UK_SURNAME_CDF, UK_SURNAMES,
     VOLUNTARY_EXCESS_BASE_WEIGHTS, VOLUNTARY_EXCESS_OPTIONS,
-    estimate_insurance_group,
+    estimate_insurance_group, lookup_band, prep_cdf, sample_cat,
 )
 
 
+# ── Per-quote draw tables, built once at import time ─────────────────────────
+# Every rng.choice(..., p=...) with literal options used to rebuild its
+# cumulative array on each quote; precompute (keys, cdf) pairs instead.
+_VRM_LETTERS = np.array(list("ABCDEFGHJKLMNOPRSTUVWXYZ"))
+_PETROL_CC_CDF = prep_cdf({999: 0.08, 1000: 0.12, 1199: 0.10, 1242: 0.10, 1332: 0.10,
+                           1498: 0.15, 1596: 0.10, 1798: 0.08, 1984: 0.07, 2000: 0.04,
+                           2500: 0.03, 2979: 0.02, 3000: 0.01})
+_DIESEL_CC_CDF = prep_cdf({1461: 0.10, 1499: 0.10, 1598: 0.12, 1956: 0.15, 1968: 0.15,
+                           1997: 0.12, 2000: 0.08, 2143: 0.08, 2993: 0.05, 3000: 0.05})
+_HYBRID_CC_CDF = prep_cdf({1498: 0.30, 1798: 0.30, 1984: 0.20, 2000: 0.20})
+_EV_BHP_CDF = prep_cdf({136: 0.15, 150: 0.15, 170: 0.15, 204: 0.20, 245: 0.15,
+                        300: 0.10, 408: 0.10})
+_OWNER_CDF = prep_cdf({"spouse_partner": 0.35, "parent": 0.30, "company": 0.20,
+                       "leasing_company": 0.15})
+_REL_MAIN_CDF = prep_cdf({"parent": 0.7, "spouse": 0.2, "other": 0.1})
+_COMP_EXCESS_CDF = prep_cdf({100: 0.10, 150: 0.40, 200: 0.30, 250: 0.20})
+# Voluntary excess varies only by age group, so all three weightings can
+# be precomputed as (options, cdf) pairs too
+_VE_OPTIONS = tuple(VOLUNTARY_EXCESS_OPTIONS)
+
+
+def _ve_cdf(scales: dict[int, float]) -> tuple[tuple, np.ndarray]:
+    w = np.array(VOLUNTARY_EXCESS_BASE_WEIGHTS, dtype=float)
+    for i, s in scales.items():
+        w[i] *= s
+    return _VE_OPTIONS, np.cumsum(w / w.sum())
+
+
+_VE_YOUNG_CDF = _ve_cdf({4: 2.0, 5: 2.0})   # under 25: £500/£1000 more likely
+_VE_OLD_CDF = _ve_cdf({0: 2.0, 1: 1.5})     # over 60: £0/£100 more likely
+_VE_MID_CDF = _ve_cdf({})
+_N_DRIVERS_PARTNERED_CDF = prep_cdf({0: 0.25, 1: 0.45, 2: 0.20, 3: 0.08, 4: 0.02})
+_N_DRIVERS_OLDER_CDF = prep_cdf({0: 0.35, 1: 0.35, 2: 0.20, 3: 0.08, 4: 0.02})
+_N_DRIVERS_YOUNG_CDF = prep_cdf({0: 0.55, 1: 0.30, 2: 0.10, 3: 0.04, 4: 0.01})
+_PARENT_MARITAL_CDF = prep_cdf({"married": 0.6, "widowed": 0.4})
+_OTHER_REL_CDF = prep_cdf({"sibling": 0.5, "other_family": 0.3, "other": 0.2})
+_MOD_TYPES = np.array(list(MODIFICATION_TYPES), dtype=object)
+_MOD_WEIGHTS = np.fromiter(MODIFICATION_TYPES.values(), dtype=np.float64)
+_MOD_WEIGHTS /= _MOD_WEIGHTS.sum()
+# Time-of-day weights for quote timestamps (evening peak)
+_HOUR_WEIGHTS = np.array([0.5, 0.2, 0.1, 0.1, 0.1, 0.1,    # 00-05
+                          0.3, 0.8, 1.5, 2.5, 3.0, 3.0,    # 06-11
+                          3.0, 3.0, 2.5, 2.5, 3.0, 3.5,    # 12-17
+                          5.0, 6.0, 6.0, 5.5, 4.0, 2.0])   # 18-23
+_HOUR_CDF = np.cumsum(_HOUR_WEIGHTS / _HOUR_WEIGHTS.sum())
+
+
+# Static lookup structures used during quote assembly — previously these
+# literals were rebuilt on every call inside the generation methods.
+_FUEL_MAP = {
+    "PETROL": "petrol", "DIESEL": "diesel",
+    "BATTERY ELECTRIC": "electric", "ELECTRIC": "electric",
+    "HYBRID ELECTRIC (PETROL)": "hybrid_petrol_electric",
+    "HYBRID ELECTRIC (DIESEL)": "hybrid_diesel_electric",
+    "PLUG-IN HYBRID ELECTRIC (PETROL)": "plug_in_hybrid",
+    "PLUG-IN HYBRID ELECTRIC (DIESEL)": "plug_in_hybrid",
+    "RANGE EXTENDED ELECTRIC": "electric",
+    "GAS": "lpg", "LPG": "lpg",
+}
+_BODY_KEYWORDS = {
+    "hatchback": ["hatchback", "hatch"],
+    "saloon": ["saloon", "sedan"],
+    "estate": ["estate", "touring", "wagon", "avant"],
+    "suv": ["suv", "crossover", "x-drive", "4x4", "sport utility"],
+    "convertible": ["convertible", "cabriolet", "roadster", "spider", "spyder"],
+    "coupe": ["coupe", "coupé"],
+    "mpv": ["mpv", "people carrier", "scenic", "touran", "zafira"],
+    "pickup": ["pickup", "pick-up", "ranger", "hilux", "navara"],
+}
+_SOC_MAJOR = {
+    "1": "Management", "2": "Professional", "3": "Technical",
+    "4": "Administrative", "5": "Skilled Trades", "6": "Care & Leisure",
+    "7": "Sales & Service", "8": "Process & Plant", "9": "Elementary",
+}
+_TIER_PRICES = {"budget": 15000, "mainstream": 25000, "premium": 40000, "luxury": 65000}
+_PREMIUM_MAKES = {"BMW", "AUDI", "MERCEDES", "MERCEDES-BENZ", "VOLVO", "LEXUS", "TESLA", "MINI"}
+_LUXURY_MAKES = {"PORSCHE", "JAGUAR", "LAND ROVER", "RANGE ROVER", "BENTLEY", "ROLLS-ROYCE",
+                 "MASERATI", "ASTON MARTIN", "FERRARI", "LAMBORGHINI", "MCLAREN"}
+_BUDGET_MAKES = {"DACIA", "MG", "SUZUKI", "FIAT"}
+_MEDICAL_CONDITIONS = ["Diabetes - insulin treated", "Epilepsy", "Visual impairment",
+                       "Heart condition", "Diabetes - diet controlled", "Sleep apnoea"]
+_HOUSE_NAMES = ["The Willows", "Rose Cottage", "Oaklands", "The Old Rectory",
+                "Hillcrest", "Fairview", "Sunnyside", "The Croft", "Greenacres",
+                "Woodlands", "The Grange", "Ivy House", "Cherry Tree House",
+                "Meadow View", "The Laurels"]
+
+
 class QuoteGenerator:
     """Generate synthetic UK motor insurance quote request JSONs."""
 
-    def __init__(self, seed: int | None = None):
-        self.rng = np.random.default_rng(seed)
+    def __init__(self, seed: int | np.random.SeedSequence | None = None):
+        # SFC64 is noticeably faster than the default PCG64 for the bulk
+        # uniform draws this generator makes (not cryptographically secure,
+        # which is fine for synthetic data)
+        self.rng = np.random.Generator(np.random.SFC64(seed))
         self.data = DistributionData()
         self._quote_counter = 0
 
@@ -41,6 +132,18 @@ class QuoteGenerator:
         """Generate n quote request dicts."""
         return [self._generate_one() for _ in range(n)]
 
+    def generate_iter(self, n: int, chunk: int = 10_000):
+        """Yield quote request dicts in lists of up to `chunk`.
+
+        Lets callers stream large runs to disk without holding all n
+        quotes in memory at once.
+        """
+        remaining = n
+        while remaining > 0:
+            size = min(chunk, remaining)
+            yield [self._generate_one() for _ in range(size)]
+            remaining -= size
+
     def _generate_one(self) -> dict:
         """Generate a single complete quote request."""
         # 1. Sample postcode (determines region, urban/rural, IMD)
@@ -85,36 +188,36 @@ class QuoteGenerator:
 
     # ── Helpers ───────────────────────────────────────────────────────────
 
+    def _pick(self, seq):
+        """Uniformly pick one element of a sequence (returns a native object,
+        unlike rng.choice which wraps it in a numpy scalar)."""
+        return seq[self.rng.integers(0, len(seq))]
+
     def _weighted_choice(self, options: dict) -> str:
-        """Choose from {option: weight} dict."""
-        keys = list(options.keys())
-        weights = np.array([options[k] for k in keys], dtype=float)
-        weights /= weights.sum()
-        return self.rng.choice(keys, p=weights)
-
-    def _age_bracket(self, age: int, brackets: dict):
-        """Look up value from {(min, max): value} dict."""
-        for (lo, hi), val in brackets.items():
-            if lo <= age < hi:
-                return val
-        # Return last bracket value as fallback
-        return list(brackets.values())[-1]
+        """Choose from an ad-hoc {option: weight} dict.
+
+        Static tables have precomputed CDFs in constants.py — use
+        `sample_cat` for those instead.
+        """
+        keys = tuple(options)
+        cum = np.cumsum(np.fromiter(options.values(), dtype=np.float64))
+        return keys[np.searchsorted(cum / cum[-1], self.rng.random())]
 
     def _gen_uk_vrm(self, year: int) -> str:
         """Generate a plausible UK VRM for a given registration year."""
         # Post-2001 format: LL NN LLL
-        letters = "ABCDEFGHJKLMNOPRSTUVWXYZ"
-        area = self.rng.choice(list(letters)) + self.rng.choice(list(letters))
+        letters = _VRM_LETTERS[self.rng.integers(0, len(_VRM_LETTERS), size=5)]
+        area = letters[0] + letters[1]
 
         # Age identifier: Mar-Aug = YY, Sep-Feb = YY+50
         # 2001 Mar = 01/51, 2002 = 02/52, ..., 2024 = 24/74
         base = year - 2000
         if base < 1:
             base = 1
-        half = self.rng.choice([0, 50])
+        half = 50 if self.rng.random() < 0.5 else 0
         age_id = f"{(base + half) % 100:02d}"
 
-        random_part = "".join(self.rng.choice(list(letters)) for _ in range(3))
+        random_part = "".join(letters[2:])
         return f"{area}{age_id} {random_part}"
 
     # ── Proposer ──────────────────────────────────────────────────────────
@@ -127,16 +230,16 @@ class QuoteGenerator:
         dob = date.today() - timedelta(days=int(age * 365.25 + self.rng.integers(0, 365)))
 
         marital = self.data.sample_marital_status(self.rng, age, gender)
-        title = self._weighted_choice(
-            TITLE_WEIGHTS.get((gender, marital), TITLE_WEIGHTS.get((gender, "single"), {"mr": 1.0}))
+        title = sample_cat(
+            self.rng, TITLE_CDF.get((gender, marital), TITLE_CDF[(gender, "single")])
         )
 
         first_name = self.data.sample_first_name(self.rng, gender)
-        last_name = self.rng.choice(UK_SURNAMES, p=UK_SURNAME_WEIGHTS)
+        last_name = UK_SURNAMES[np.searchsorted(UK_SURNAME_CDF, self.rng.random())]
 
         # Employment status
-        emp_dist = self._age_bracket(age, EMPLOYMENT_BY_AGE)
-        employment = self._weighted_choice(emp_dist)
+        emp_cdf = lookup_band(EMPLOYMENT_CDF_BANDS, age)
+        employment = sample_cat(self.rng, emp_cdf)
 
         # Occupation (only if employed/self-employed)
         occupation = None
@@ -145,12 +248,7 @@ class QuoteGenerator:
             occ_name, soc_code = self.data.sample_occupation(self.rng, gender)
             occupation = occ_name
             # Derive industry from first digit of SOC code
-            soc_major = {
-                "1": "Management", "2": "Professional", "3": "Technical",
-                "4": "Administrative", "5": "Skilled Trades", "6": "Care & Leisure",
-                "7": "Sales & Service", "8": "Process & Plant", "9": "Elementary",
-            }
-            occupation_industry = soc_major.get(soc_code[0], "Other") if soc_code else None
+            occupation_industry = _SOC_MAJOR.get(soc_code[0], "Other") if soc_code else None
 
         secondary_occ = None
         if employment in ("employed", "self_employed") and self.rng.random() < 0.05:
@@ -182,24 +280,22 @@ class QuoteGenerator:
                 licence_type = "full_eu"
 
         # Medical conditions
-        med_rate = self._age_bracket(age, MEDICAL_RATE_BY_AGE)
+        med_rate = lookup_band(MEDICAL_RATE_BANDS, age)
         has_medical = self.rng.random() < med_rate
         med_details = None
         if has_medical:
-            conditions = ["Diabetes - insulin treated", "Epilepsy", "Visual impairment",
-                          "Heart condition", "Diabetes - diet controlled", "Sleep apnoea"]
-            med_details = self.rng.choice(conditions)
+            med_details = self._pick(_MEDICAL_CONDITIONS)
 
         # Criminal convictions (non-motoring)
         has_criminal = self.rng.random() < (0.03 if gender == "male" and age < 35 else 0.01)
 
         # Other fields
-        is_homeowner = self.rng.random() < self._age_bracket(age, HOMEOWNER_RATE_BY_AGE)
+        is_homeowner = self.rng.random() < lookup_band(HOMEOWNER_RATE_BANDS, age)
         access_other = self.rng.random() < (0.45 if marital in ("married", "civil_partnership", "living_with_partner") else 0.25)
         is_main_driver = self.rng.random() < 0.95
         rel_main = None
         if not is_main_driver:
-            rel_main = self.rng.choice(["parent", "spouse", "other"], p=[0.7, 0.2, 0.1])
+            rel_main = sample_cat(self.rng, _REL_MAIN_CDF)
 
         proposer = {
             "title": title,
@@ -249,17 +345,7 @@ class QuoteGenerator:
         fuel_raw = veh["fuel"].upper()
 
         # Map fuel to schema enum
-        fuel_map = {
-            "PETROL": "petrol", "DIESEL": "diesel",
-            "BATTERY ELECTRIC": "electric", "ELECTRIC": "electric",
-            "HYBRID ELECTRIC (PETROL)": "hybrid_petrol_electric",
-            "HYBRID ELECTRIC (DIESEL)": "hybrid_diesel_electric",
-            "PLUG-IN HYBRID ELECTRIC (PETROL)": "plug_in_hybrid",
-            "PLUG-IN HYBRID ELECTRIC (DIESEL)": "plug_in_hybrid",
-            "RANGE EXTENDED ELECTRIC": "electric",
-            "GAS": "lpg", "LPG": "lpg",
-        }
-        fuel = fuel_map.get(fuel_raw, "other")
+        fuel = _FUEL_MAP.get(fuel_raw, "other")
 
         # Vehicle age — sample from reasonable distribution conditioned on proposer age
         age = proposer_meta["age"]
@@ -278,19 +364,9 @@ class QuoteGenerator:
         year_reg = year_mfg if self.rng.random() < 0.90 else year_mfg + 1
 
         # Body type inference (simplified)
-        body_keywords = {
-            "hatchback": ["hatchback", "hatch"],
-            "saloon": ["saloon", "sedan"],
-            "estate": ["estate", "touring", "wagon", "avant"],
-            "suv": ["suv", "crossover", "x-drive", "4x4", "sport utility"],
-            "convertible": ["convertible", "cabriolet", "roadster", "spider", "spyder"],
-            "coupe": ["coupe", "coupé"],
-            "mpv": ["mpv", "people carrier", "scenic", "touran", "zafira"],
-            "pickup": ["pickup", "pick-up", "ranger", "hilux", "navara"],
-        }
         body_type = "hatchback"  # default
         model_lower = model.lower()
-        for bt, keywords in body_keywords.items():
+        for bt, keywords in _BODY_KEYWORDS.items():
             if any(kw in model_lower for kw in keywords):
                 body_type = bt
                 break
@@ -312,13 +388,11 @@ class QuoteGenerator:
         engine_cc = None
         if fuel not in ("electric",):
             if fuel == "petrol":
-                engine_cc = int(self.rng.choice([999, 1000, 1199, 1242, 1332, 1498, 1596, 1798, 1984, 2000, 2500, 2979, 3000],
-                                                 p=[0.08, 0.12, 0.10, 0.10, 0.10, 0.15, 0.10, 0.08, 0.07, 0.04, 0.03, 0.02, 0.01]))
+                engine_cc = sample_cat(self.rng, _PETROL_CC_CDF)
             elif fuel == "diesel":
-                engine_cc = int(self.rng.choice([1461, 1499, 1598, 1956, 1968, 1997, 2000, 2143, 2993, 3000],
-                                                 p=[0.10, 0.10, 0.12, 0.15, 0.15, 0.12, 0.08, 0.08, 0.05, 0.05]))
+                engine_cc = sample_cat(self.rng, _DIESEL_CC_CDF)
             else:
-                engine_cc = int(self.rng.choice([1498, 1798, 1984, 2000], p=[0.30, 0.30, 0.20, 0.20]))
+                engine_cc = sample_cat(self.rng, _HYBRID_CC_CDF)
 
         # BHP estimate
         bhp = None
@@ -326,31 +400,22 @@ class QuoteGenerator:
             bhp = int(engine_cc * (0.06 + self.rng.normal(0, 0.01)) + self.rng.normal(0, 10))
             bhp = max(60, min(bhp, 500))
         elif fuel == "electric":
-            bhp = int(self.rng.choice([136, 150, 170, 204, 245, 300, 408],
-                                       p=[0.15, 0.15, 0.15, 0.20, 0.15, 0.10, 0.10]))
+            bhp = sample_cat(self.rng, _EV_BHP_CDF)
 
         # Doors and seats
-        doors = self._weighted_choice(BODY_TYPE_DOORS.get(body_type, {5: 1.0}))
-        seats = self._weighted_choice(BODY_TYPE_SEATS.get(body_type, {5: 1.0}))
-
-        # Estimated value (depreciation curve)
-        # Rough new prices by make tier
-        tier_prices = {
-            "budget": 15000, "mainstream": 25000, "premium": 40000, "luxury": 65000,
-        }
-        premium_makes = {"BMW", "AUDI", "MERCEDES", "MERCEDES-BENZ", "VOLVO", "LEXUS", "TESLA", "MINI"}
-        luxury_makes = {"PORSCHE", "JAGUAR", "LAND ROVER", "RANGE ROVER", "BENTLEY", "ROLLS-ROYCE", "MASERATI", "ASTON MARTIN", "FERRARI", "LAMBORGHINI", "MCLAREN"}
-        budget_makes = {"DACIA", "MG", "SUZUKI", "FIAT"}
+        doors = sample_cat(self.rng, BODY_TYPE_DOORS_CDF.get(body_type, BODY_TYPE_DOORS_CDF["other"]))
+        seats = sample_cat(self.rng, BODY_TYPE_SEATS_CDF.get(body_type, BODY_TYPE_SEATS_CDF["other"]))
 
+        # Estimated value (depreciation curve) — rough new prices by make tier
         make_upper = make.upper()
-        if make_upper in luxury_makes:
-            new_price = tier_prices["luxury"]
-        elif make_upper in premium_makes:
-            new_price = tier_prices["premium"]
-        elif make_upper in budget_makes:
-            new_price = tier_prices["budget"]
+        if make_upper in _LUXURY_MAKES:
+            new_price = _TIER_PRICES["luxury"]
+        elif make_upper in _PREMIUM_MAKES:
+            new_price = _TIER_PRICES["premium"]
+        elif make_upper in _BUDGET_MAKES:
+            new_price = _TIER_PRICES["budget"]
         else:
-            new_price = tier_prices["mainstream"]
+            new_price = _TIER_PRICES["mainstream"]
 
         # Add noise to new price
         new_price = int(new_price * (1 + self.rng.normal(0, 0.15)))
@@ -364,8 +429,8 @@ class QuoteGenerator:
         reg = self._gen_uk_vrm(year_reg)
 
         # Security
-        alarm_rate = self._age_bracket(veh_age, SECURITY_FACTORY_ALARM_RATE)
-        immo_rate = self._age_bracket(veh_age, SECURITY_FACTORY_IMMOBILISER_RATE)
+        alarm_rate = lookup_band(ALARM_RATE_BANDS, veh_age)
+        immo_rate = lookup_band(IMMOBILISER_RATE_BANDS, veh_age)
 
         if self.rng.random() < alarm_rate:
             alarm = "factory_fitted"
@@ -383,17 +448,17 @@ class QuoteGenerator:
 
         tracker_rate = 0.15 if ins_group >= 35 else (0.08 if ins_group >= 25 else 0.03)
         if self.rng.random() < tracker_rate:
-            tracker = self.rng.choice(["thatcham_cat_5", "thatcham_cat_6", "thatcham_s5"])
+            tracker = self._pick(("thatcham_cat_5", "thatcham_cat_6", "thatcham_s5"))
         else:
             tracker = "none"
 
         # Overnight location
         is_urban = bool(pc.get("is_urban", True))
-        overnight = self._weighted_choice(OVERNIGHT_URBAN if is_urban else OVERNIGHT_RURAL)
+        overnight = sample_cat(self.rng, OVERNIGHT_URBAN_CDF if is_urban else OVERNIGHT_RURAL_CDF)
 
         # Daytime location
         commuting = proposer_meta["employment"] in ("employed", "self_employed")
-        daytime = self._weighted_choice(DAYTIME_COMMUTING if commuting else DAYTIME_NO_COMMUTING)
+        daytime = sample_cat(self.rng, DAYTIME_COMMUTING_CDF if commuting else DAYTIME_NO_COMMUTING_CDF)
 
         # Modifications
         mod_rate = 0.12 if proposer_meta["age"] < 30 and proposer_meta["gender"] == "male" else 0.04
@@ -401,15 +466,11 @@ class QuoteGenerator:
         modifications = []
         if has_mods:
             n_mods = min(int(self.rng.exponential(1.5)) + 1, 4)
-            mod_types = list(MODIFICATION_TYPES.keys())
-            mod_weights = np.array(list(MODIFICATION_TYPES.values()))
-            mod_weights /= mod_weights.sum()
-            chosen = self.rng.choice(mod_types, size=n_mods, replace=False, p=mod_weights)
+            chosen = self.rng.choice(_MOD_TYPES, size=n_mods, replace=False, p=_MOD_WEIGHTS)
             modifications = [{"modification_type": m, "details": None} for m in chosen]
 
         # Owner / keeper
-        owner = "proposer" if self.rng.random() < 0.90 else self.rng.choice(
-            ["spouse_partner", "parent", "company", "leasing_company"], p=[0.35, 0.30, 0.20, 0.15])
+        owner = "proposer" if self.rng.random() < 0.90 else sample_cat(self.rng, _OWNER_CDF)
         keeper = owner if self.rng.random() < 0.92 else "proposer"
 
         # Purchase date
@@ -486,16 +547,13 @@ class QuoteGenerator:
         payment = self._weighted_choice(pf_weights)
 
         # Voluntary excess — younger → higher to reduce premium
-        ve_weights = list(VOLUNTARY_EXCESS_BASE_WEIGHTS)
         if age < 25:
-            ve_weights[4] *= 2.0  # £500
-            ve_weights[5] *= 2.0  # £1000
+            ve_cdf = _VE_YOUNG_CDF
         elif age > 60:
-            ve_weights[0] *= 2.0  # £0
-            ve_weights[1] *= 1.5  # £100
-        ve_weights = np.array(ve_weights)
-        ve_weights /= ve_weights.sum()
-        vol_excess = int(self.rng.choice(VOLUNTARY_EXCESS_OPTIONS, p=ve_weights))
+            ve_cdf = _VE_OLD_CDF
+        else:
+            ve_cdf = _VE_MID_CDF
+        vol_excess = int(sample_cat(self.rng, ve_cdf))
 
         # Compulsory excess
         if age < 21:
@@ -505,7 +563,7 @@ class QuoteGenerator:
         elif age > 65:
             comp_excess = 100
         else:
-            comp_excess = self.rng.choice([100, 150, 200, 250], p=[0.10, 0.40, 0.30, 0.20])
+            comp_excess = sample_cat(self.rng, _COMP_EXCESS_CDF)
 
         # NCD years (correlated with licence years)
         max_ncd = min(proposer_meta["licence_years"], 20)
@@ -549,7 +607,7 @@ class QuoteGenerator:
         is_renewal = self.rng.random() < 0.60
         prev_insurer = None
         if is_renewal:
-            prev_insurer = self._weighted_choice(PREVIOUS_INSURERS)
+            prev_insurer = sample_cat(self.rng, PREVIOUS_INSURER_CDF)
 
         return {
             "policy_number": None,
@@ -589,8 +647,8 @@ class QuoteGenerator:
             days_ago = self.rng.integers(30, 5 * 365)
             claim_date = (date.today() - timedelta(days=int(days_ago))).isoformat()
 
-            claim_type = self._weighted_choice(CLAIM_TYPE_WEIGHTS)
-            fault = self._weighted_choice(FAULT_WEIGHTS_BY_TYPE.get(claim_type, {"at_fault": 0.5, "not_at_fault": 0.5}))
+            claim_type = sample_cat(self.rng, CLAIM_TYPE_CDF)
+            fault = sample_cat(self.rng, FAULT_CDF_BY_TYPE.get(claim_type, FAULT_CDF_BY_TYPE["other"]))
 
             # Status
             status = "settled" if days_ago > 180 else ("settled" if self.rng.random() < 0.80 else "open")
@@ -639,7 +697,7 @@ class QuoteGenerator:
         n_conv = 1 if self.rng.random() < 0.85 else (2 if self.rng.random() < 0.80 else 3)
         convictions = []
         for _ in range(n_conv):
-            code = self._weighted_choice(CONVICTION_CODE_WEIGHTS)
+            code = sample_cat(self.rng, CONVICTION_CODE_CDF)
             info = CONVICTION_CODES[code]
             desc, min_pts, max_pts, typical_fine, ban_range = info
 
@@ -676,13 +734,13 @@ class QuoteGenerator:
 
         # Number of additional drivers
         if marital in ("married", "civil_partnership", "living_with_partner"):
-            n_weights = [0.25, 0.45, 0.20, 0.08, 0.02]
+            n_cdf = _N_DRIVERS_PARTNERED_CDF
         elif age >= 40:
-            n_weights = [0.35, 0.35, 0.20, 0.08, 0.02]
+            n_cdf = _N_DRIVERS_OLDER_CDF
         else:
-            n_weights = [0.55, 0.30, 0.10, 0.04, 0.01]
+            n_cdf = _N_DRIVERS_YOUNG_CDF
 
-        n_drivers = self.rng.choice([0, 1, 2, 3, 4], p=n_weights)
+        n_drivers = sample_cat(self.rng, n_cdf)
         drivers = []
 
         for i in range(n_drivers):
@@ -695,42 +753,39 @@ class QuoteGenerator:
             elif age >= 40 and self.rng.random() < 0.40:
                 rel = "child"
                 d_age = max(17, age - self.rng.integers(18, 28))
-                d_gender = self.rng.choice(["male", "female"])
+                d_gender = self._pick(("male", "female"))
                 d_marital = "single"
             elif self.rng.random() < 0.15:
                 rel = "parent"
                 d_age = min(90, age + self.rng.integers(20, 35))
-                d_gender = self.rng.choice(["male", "female"])
-                d_marital = self.rng.choice(["married", "widowed"], p=[0.6, 0.4])
+                d_gender = self._pick(("male", "female"))
+                d_marital = sample_cat(self.rng, _PARENT_MARITAL_CDF)
             else:
-                rel = self.rng.choice(["sibling", "other_family", "other"], p=[0.5, 0.3, 0.2])
+                rel = sample_cat(self.rng, _OTHER_REL_CDF)
                 d_age = max(17, age + self.rng.integers(-10, 11))
-                d_gender = self.rng.choice(["male", "female"])
+                d_gender = self._pick(("male", "female"))
                 d_marital = self.data.sample_marital_status(self.rng, d_age, d_gender)
 
             d_age = max(17, min(d_age, 90))
             d_dob = date.today() - timedelta(days=int(d_age * 365.25 + self.rng.integers(0, 365)))
 
-            d_title = self._weighted_choice(
-                TITLE_WEIGHTS.get((d_gender, d_marital), TITLE_WEIGHTS.get((d_gender, "single"), {"mr": 1.0}))
+            d_title = sample_cat(
+                self.rng, TITLE_CDF.get((d_gender, d_marital), TITLE_CDF[(d_gender, "single")])
             )
             d_first = self.data.sample_first_name(self.rng, d_gender)
             # Spouse/family: often same surname
             if rel in ("spouse", "partner", "common_law_partner", "child"):
-                d_last = proposer_meta["last_name"] if self.rng.random() < 0.85 else self.rng.choice(UK_SURNAMES, p=UK_SURNAME_WEIGHTS)
+                d_last = proposer_meta["last_name"] if self.rng.random() < 0.85 else UK_SURNAMES[np.searchsorted(UK_SURNAME_CDF, self.rng.random())]
             else:
-                d_last = self.rng.choice(UK_SURNAMES, p=UK_SURNAME_WEIGHTS)
+                d_last = UK_SURNAMES[np.searchsorted(UK_SURNAME_CDF, self.rng.random())]
 
             # Employment
-            d_emp = self._weighted_choice(self._age_bracket(d_age, EMPLOYMENT_BY_AGE))
+            d_emp = sample_cat(self.rng, lookup_band(EMPLOYMENT_CDF_BANDS, d_age))
             d_occ, d_occ_ind = None, None
             if d_emp in ("employed", "self_employed"):
                 occ_name, soc_code = self.data.sample_occupation(self.rng, d_gender)
                 d_occ = occ_name
-                soc_major = {"1": "Management", "2": "Professional", "3": "Technical",
-                             "4": "Administrative", "5": "Skilled Trades", "6": "Care & Leisure",
-                             "7": "Sales & Service", "8": "Process & Plant", "9": "Elementary"}
-                d_occ_ind = soc_major.get(soc_code[0], "Other") if soc_code else None
+                d_occ_ind = _SOC_MAJOR.get(soc_code[0], "Other") if soc_code else None
 
             # Licence
             d_pass_age = max(17, min(d_age, 17 + int(self.rng.exponential(2.5))))
@@ -746,7 +801,7 @@ class QuoteGenerator:
                 yrs = int(self.rng.uniform(1, min(d_age - 16, 25)))
                 d_uk_since = (date.today() - timedelta(days=int(yrs * 365.25))).isoformat()
 
-            d_med_rate = self._age_bracket(d_age, MEDICAL_RATE_BY_AGE)
+            d_med_rate = lookup_band(MEDICAL_RATE_BANDS, d_age)
 
             driver = {
                 "title": d_title,
@@ -797,7 +852,7 @@ class QuoteGenerator:
             selected = self.rng.random() < min(rate, 0.95)
             level = None
             if selected and addon == "breakdown_cover":
-                level = self._weighted_choice(BREAKDOWN_LEVELS)
+                level = sample_cat(self.rng, BREAKDOWN_LEVELS_CDF)
             elif selected and addon == "no_claims_step_back":
                 level = None  # no sub-level
 
@@ -813,7 +868,7 @@ class QuoteGenerator:
         quote_id = f"QUO-{date.today().year}-{self._quote_counter:09d}"
 
         # Timestamp: evening peak (18-21), some during day
-        hour = self.rng.choice(range(24), p=self._hour_weights())
+        hour = int(np.searchsorted(_HOUR_CDF, self.rng.random()))
         minute = self.rng.integers(0, 60)
         second = self.rng.integers(0, 60)
 
@@ -827,7 +882,7 @@ class QuoteGenerator:
         ts = datetime(quote_date.year, quote_date.month, quote_date.day,
                       hour, minute, second)
 
-        channel = self._weighted_choice(CHANNEL_WEIGHTS)
+        channel = sample_cat(self.rng, CHANNEL_CDF)
         agg_id = None
         if channel in AGGREGATOR_CHANNELS:
             prefix = AGGREGATOR_PREFIX[channel]
@@ -847,16 +902,6 @@ class QuoteGenerator:
             "aggregator_quote_id": agg_id,
         }
 
-    @staticmethod
-    def _hour_weights():
-        """Time-of-day weights for quote generation (evening peak)."""
-        w = [0.5, 0.2, 0.1, 0.1, 0.1, 0.1,     # 00-05
-             0.3, 0.8, 1.5, 2.5, 3.0, 3.0,       # 06-11
-             3.0, 3.0, 2.5, 2.5, 3.0, 3.5,        # 12-17
-             5.0, 6.0, 6.0, 5.5, 4.0, 2.0]        # 18-23
-        total = sum(w)
-        return [x / total for x in w]
-
     # ── Address ───────────────────────────────────────────────────────────
 
     def _gen_address(self, pc, proposer_meta: dict) -> dict:
@@ -867,19 +912,15 @@ class QuoteGenerator:
             postcode = postcode[:-3] + " " + postcode[-3:]
         region = pc.get("rgn_name", "Unknown")
         cities = REGION_CITIES.get(region, ["Town"])
-        city = self.rng.choice(cities)
+        city = self._pick(cities)
 
-        street = self.rng.choice(UK_STREET_NAMES)
+        street = self._pick(UK_STREET_NAMES)
 
         # House number (80% numeric, 20% named)
         if self.rng.random() < 0.80:
             house = str(int(self.rng.exponential(30)) + 1)
         else:
-            house_names = ["The Willows", "Rose Cottage", "Oaklands", "The Old Rectory",
-                           "Hillcrest", "Fairview", "Sunnyside", "The Croft", "Greenacres",
-                           "Woodlands", "The Grange", "Ivy House", "Cherry Tree House",
-                           "Meadow View", "The Laurels"]
-            house = self.rng.choice(house_names)
+            house = self._pick(_HOUSE_NAMES)
 
         # Years at address — correlated with age and homeownership
         age = proposer_meta["age"]
@@ -911,14 +952,14 @@ class QuoteGenerator:
 
         region = prev_pc.get("rgn_name", "Unknown")
         cities = REGION_CITIES.get(region, ["Town"])
-        city = self.rng.choice(cities)
-        street = self.rng.choice(UK_STREET_NAMES)
+        city = self._pick(cities)
+        street = self._pick(UK_STREET_NAMES)
 
         if self.rng.random() < 0.80:
             house = str(int(self.rng.exponential(30)) + 1)
         else:
-            house = self.rng.choice(["Flat " + str(self.rng.integers(1, 20)),
-                                     str(self.rng.integers(1, 100))])
+            house = ("Flat " + str(self.rng.integers(1, 20))
+                     if self.rng.random() < 0.5 else str(self.rng.integers(1, 100)))
 
         return {
             "house_number_or_name": house,
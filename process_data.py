@@ -7,9 +7,13 @@ Usage:
 """
 
 import argparse
+import contextlib
 import importlib
+import io
+import os
 import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 PROCESSORS = {
@@ -27,6 +31,23 @@ PROCESSORS = {
 }
 
 
+def _run_one(name: str, module_path: str) -> tuple[str, str, str, str]:
+    """Worker: run one processor, capturing its prints for ordered display."""
+    buf = io.StringIO()
+    t0 = time.time()
+    try:
+        with contextlib.redirect_stdout(buf):
+            importlib.import_module(module_path).process()
+        elapsed = time.time() - t0
+        buf.write(f"  Done in {elapsed:.1f}s\n")
+        return name, "✓", f"{elapsed:.1f}s", buf.getvalue()
+    except Exception as e:
+        elapsed = time.time() - t0
+        traceback.print_exc(file=buf)
+        buf.write(f"  FAILED ({elapsed:.1f}s): {e}\n")
+        return name, "✗", str(e), buf.getvalue()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Process raw data into distribution tables")
     parser.add_argument("--only", nargs="+", choices=list(PROCESSORS.keys()),
@@ -47,23 +68,21 @@ def main():
     print(f"Processing {len(to_run)} dataset(s)")
     print(f"{'=' * 60}")
 
+    # Processors are fully independent (distinct raw inputs, distinct
+    # output parquets) — run them across worker processes
     results = {}
-    for name, module_path in to_run.items():
-        print(f"\n{'─' * 60}")
-        print(f"[{name}]")
-        print(f"{'─' * 60}")
-        t0 = time.time()
-        try:
-            mod = importlib.import_module(module_path)
-            mod.process()
-            elapsed = time.time() - t0
-            results[name] = ("✓", f"{elapsed:.1f}s")
-            print(f"  Done in {elapsed:.1f}s")
-        except Exception as e:
-            elapsed = time.time() - t0
-            results[name] = ("✗", str(e))
-            print(f"  FAILED ({elapsed:.1f}s): {e}")
-            traceback.print_exc()
+    with ProcessPoolExecutor(max_workers=min(len(to_run), os.cpu_count())) as ex:
+        futures = {ex.submit(_run_one, name, mp): name
+                   for name, mp in to_run.items()}
+        for fut in as_completed(futures):
+            name, status, detail, output = fut.result()
+            results[name] = (status, detail)
+            print(f"\n{'─' * 60}")
+            print(f"[{name}]")
+            print(f"{'─' * 60}")
+            print(output, end="")
+    # Restore submission order for the summary
+    results = {name: results[name] for name in to_run}
 
     # Summary
     print(f"\n{'=' * 60}")
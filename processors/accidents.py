@@ -10,86 +10,124 @@ Output: data/processed/accident_rates.parquet
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow.csv as pv
+
+from processors import write_processed
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
 
+def _header_names(path: Path) -> dict[str, str]:
+    """Sniff only the CSV header; map lowered/stripped names to originals."""
+    with pv.open_csv(path) as reader:
+        return {name.lower().strip(): name for name in reader.schema.names}
+
+
+def _read_selected(path: Path, names: dict[str, str], cols: list[str]) -> pd.DataFrame:
+    """Read just `cols` from a CSV — unused columns are never parsed."""
+    table = pv.read_csv(path, convert_options=pv.ConvertOptions(
+        include_columns=[names[c] for c in cols]))
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    df.columns = df.columns.str.lower().str.strip()
+    return df
+
+
 def process() -> pd.DataFrame:
     """Parse STATS19 vehicle-level data for accident rate proxies."""
     veh_path = RAW_DIR / "dft-road-casualty-statistics-vehicle-provisional-2025.csv"
     col_path = RAW_DIR / "dft-road-casualty-statistics-collision-provisional-2025.csv"
 
-    veh = pd.read_csv(veh_path, low_memory=False)
-    col = pd.read_csv(col_path, low_memory=False)
-
-    print(f"  Vehicles file: {len(veh):,} rows, columns: {veh.columns.tolist()[:10]}...")
-    print(f"  Collisions file: {len(col):,} rows, columns: {col.columns.tolist()[:10]}...")
-
-    # Standardise column names to lower
-    veh.columns = veh.columns.str.lower().str.strip()
-    col.columns = col.columns.str.lower().str.strip()
+    # Resolve which of the 40+ columns we actually need from the headers
+    # alone, then push the selection down into the Arrow CSV reader
+    veh_names = _header_names(veh_path)
+    col_names = _header_names(col_path)
+    print(f"  Vehicles file columns: {list(veh_names)[:10]}...")
+    print(f"  Collisions file columns: {list(col_names)[:10]}...")
 
     # Find age column (varies by year: 'age_of_driver', 'driver_age', etc.)
     age_col = None
     for candidate in ["age_of_driver", "driver_age", "age_band_of_driver"]:
-        if candidate in veh.columns:
+        if candidate in veh_names:
             age_col = candidate
             break
     if age_col is None:
-        print(f"  Available vehicle columns: {veh.columns.tolist()}")
+        print(f"  Available vehicle columns: {list(veh_names)}")
         # Try to find any column with 'age' and 'driver'
-        age_cols = [c for c in veh.columns if "age" in c and "driver" in c]
+        age_cols = [c for c in veh_names if "age" in c and "driver" in c]
         if age_cols:
             age_col = age_cols[0]
         else:
-            age_col = [c for c in veh.columns if "age" in c][0] if any("age" in c for c in veh.columns) else None
-
-    if age_col:
-        print(f"  Using age column: {age_col}")
-        veh["driver_age"] = pd.to_numeric(veh[age_col], errors="coerce")
-    else:
-        print("  WARNING: No driver age column found")
-        veh["driver_age"] = None
+            age_col = next((c for c in veh_names if "age" in c), None)
 
     # Find vehicle type column
     vtype_col = None
     for candidate in ["vehicle_type", "type_of_vehicle"]:
-        if candidate in veh.columns:
+        if candidate in veh_names:
             vtype_col = candidate
             break
 
     # Merge collision severity
     severity_col = None
     for candidate in ["accident_severity", "collision_severity", "severity"]:
-        if candidate in col.columns:
+        if candidate in col_names:
             severity_col = candidate
             break
 
     # Find the join key
     join_col = None
     for candidate in ["accident_index", "collision_index", "accident_reference"]:
-        if candidate in veh.columns and candidate in col.columns:
+        if candidate in veh_names and candidate in col_names:
             join_col = candidate
             break
 
+    wanted = [c for c in (join_col, age_col, vtype_col) if c]
+    veh = _read_selected(veh_path, veh_names, wanted)
+    print(f"  Vehicles file: {len(veh):,} rows")
+
+    if age_col:
+        print(f"  Using age column: {age_col}")
+        veh["driver_age"] = pd.to_numeric(veh[age_col], errors="coerce")
+    else:
+        print("  WARNING: No driver age column found")
+        veh["driver_age"] = None
+
     if join_col and severity_col:
-        veh = veh.merge(col[[join_col, severity_col]].drop_duplicates(), on=join_col, how="left")
+        col = _read_selected(col_path, col_names, [join_col, severity_col])
+        print(f"  Collisions file: {len(col):,} rows")
+        # Factorize the string join key once, then join on int codes:
+        # a dense array gather instead of pandas hashing object dtype
+        codes, uniques = pd.factorize(
+            pd.concat([veh[join_col], col[join_col]], ignore_index=True))
+        veh_codes, col_codes = codes[:len(veh)], codes[len(veh):]
+        sev_map = np.full(len(uniques), np.nan)
+        # np.unique keeps the first occurrence per key — same as merging
+        # the deduplicated collisions table
+        keys, first_idx = np.unique(col_codes, return_index=True)
+        sev_map[keys] = col[severity_col].to_numpy()[first_idx]
+        veh[severity_col] = sev_map[veh_codes]
         print(f"  Merged severity from collisions via {join_col}")
     else:
         print(f"  Could not merge severity (join_col={join_col}, severity_col={severity_col})")
 
     # Create age bands
     if veh["driver_age"].notna().any():
-        age_bins = [17, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 100]
-        veh["age_band"] = pd.cut(veh["driver_age"], bins=age_bins, right=False)
-
-        # Accident count by age band
-        age_acc = veh.groupby("age_band", observed=True).size().reset_index(name="accident_count")
-        age_acc["age_band"] = age_acc["age_band"].astype(str)
-        total = age_acc["accident_count"].sum()
-        age_acc["weight"] = age_acc["accident_count"] / total
+        # searchsorted + bincount: a single pass over a float array rather
+        # than pd.cut's interval Categorical plus a groupby
+        age_bins = np.array([17, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 100])
+        n_bands = len(age_bins) - 1
+        ages = veh["driver_age"].to_numpy(dtype=float)
+        band = np.searchsorted(age_bins, ages, side="right") - 1
+        valid = ~np.isnan(ages) & (band >= 0) & (band < n_bands)
+        counts = np.bincount(band[valid].astype(int), minlength=n_bands)
+        age_acc = pd.DataFrame({
+            "age_band": [f"[{age_bins[i]}, {age_bins[i + 1]})" for i in range(n_bands)],
+            "accident_count": counts,
+        })
+        age_acc = age_acc[age_acc["accident_count"] > 0].reset_index(drop=True)
+        age_acc["weight"] = age_acc["accident_count"] / age_acc["accident_count"].sum()
 
         print(f"  Accidents by driver age band:")
         for _, row in age_acc.iterrows():
@@ -108,7 +146,7 @@ def process() -> pd.DataFrame:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUT_DIR / "accident_rates.parquet"
     if len(age_acc) > 0:
-        age_acc.to_parquet(out_path, index=False)
+        write_processed(age_acc, out_path)
         print(f"  Saved: {out_path}")
     else:
         print("  WARNING: No age-band data to save")
@@ -2,7 +2,8 @@
 Process freMTPL2 into claim frequency and severity distributions.
 
 Input:  data/raw/freMTPL2freq.arff, data/raw/freMTPL2sev.arff
-Output: data/processed/claim_frequency.parquet   — policy-level claim counts with risk factors
+Output: data/processed/claim_frequency/        — policy-level claim counts with risk factors
+                                                 (hive-partitioned parquet, keyed by Region)
         data/processed/claim_severity.parquet    — individual claim amounts
         data/processed/claim_freq_by_age.parquet — claim rate by driver age band
 """
@@ -11,37 +12,51 @@ from pathlib import Path
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+
+from processors import write_partitioned, write_processed
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
 
 def _read_arff(fpath: Path) -> pd.DataFrame:
-    """Simple ARFF reader — skip header, read CSV data section."""
-    with open(fpath) as f:
-        lines = f.readlines()
-
-    # Find @data marker
-    data_start = None
-    attributes = []
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.lower().startswith("@attribute"):
-            parts = stripped.split()
-            attr_name = parts[1]
-            attributes.append(attr_name)
-        if stripped.lower() == "@data":
-            data_start = i + 1
-            break
-
-    if data_start is None:
-        raise ValueError(f"No @data section found in {fpath}")
-
-    # Read CSV portion
-    from io import StringIO
-    csv_text = "".join(lines[data_start:])
-    df = pd.read_csv(StringIO(csv_text), header=None, names=attributes, quotechar="'")
-    return df
+    """Simple ARFF reader — stream the header, Arrow-parse the data section.
+
+    The header is scanned line-by-line (constant memory) to collect
+    attribute names and types; the rest of the file is plain CSV and goes
+    straight to pyarrow's multi-threaded reader with an explicit schema,
+    with no intermediate Python-string copy of the data bytes.
+    """
+    attributes: list[str] = []
+    types: dict[str, pa.DataType] = {}
+    with open(fpath, "rb") as f:
+        while True:
+            line = f.readline()
+            if not line:
+                raise ValueError(f"No @data section found in {fpath}")
+            stripped = line.strip().lower()
+            if stripped.startswith(b"@attribute"):
+                parts = line.split()
+                name = parts[1].decode()
+                attributes.append(name)
+                decl = parts[2].lower() if len(parts) > 2 else b""
+                if decl in (b"numeric", b"real"):
+                    types[name] = pa.float64()
+                elif decl == b"integer":
+                    types[name] = pa.int64()
+                else:
+                    types[name] = pa.string()  # nominal {...} or string
+            elif stripped == b"@data":
+                break
+        table = pv.read_csv(
+            f,
+            read_options=pv.ReadOptions(column_names=attributes),
+            parse_options=pv.ParseOptions(quote_char="'"),
+            convert_options=pv.ConvertOptions(column_types=types),
+        )
+    return table.to_pandas(split_blocks=True, self_destruct=True)
 
 
 def process() -> dict[str, pd.DataFrame]:
@@ -74,15 +89,23 @@ def process() -> dict[str, pd.DataFrame]:
         print(f"    {n_claims} claims: {count:,} ({count / len(freq):.1%})")
 
     # ── Claim rate by driver age band ──
-    age_bins = [17, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 100]
-    freq["age_band"] = pd.cut(freq["DrivAge"], bins=age_bins, right=False)
-    age_stats = freq.groupby("age_band", observed=True).agg(
-        policies=("IDpol", "count"),
-        exposure=("Exposure", "sum"),
-        claims=("ClaimNb", "sum"),
-    ).reset_index()
+    # searchsorted + bincount instead of pd.cut + groupby: one pass over
+    # plain int arrays, no interval-Categorical machinery
+    age_bins = np.array([17, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 100])
+    n_bands = len(age_bins) - 1
+    band = np.searchsorted(age_bins, freq["DrivAge"].to_numpy(), side="right") - 1
+    valid = (band >= 0) & (band < n_bands)
+    b = band[valid]
+    age_stats = pd.DataFrame({
+        "age_band": [f"[{age_bins[i]}, {age_bins[i + 1]})" for i in range(n_bands)],
+        "policies": np.bincount(b, minlength=n_bands),
+        "exposure": np.bincount(b, weights=freq["Exposure"].to_numpy()[valid],
+                                minlength=n_bands),
+        "claims": np.bincount(b, weights=freq["ClaimNb"].to_numpy()[valid],
+                              minlength=n_bands),
+    })
+    age_stats = age_stats[age_stats["policies"] > 0].reset_index(drop=True)
     age_stats["claim_rate"] = age_stats["claims"] / age_stats["exposure"]
-    age_stats["age_band"] = age_stats["age_band"].astype(str)
 
     print(f"  Claim rate by age:")
     for _, row in age_stats.iterrows():
@@ -108,17 +131,20 @@ def process() -> dict[str, pd.DataFrame]:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     # Drop the interval column before saving (it's saved separately in age_stats)
+    # The policy-level table is the one row-level output here (~680K rows);
+    # partitioning it by Region lets downstream analyses read one region's
+    # directory instead of decoding the whole dataset
     freq_save = freq.drop(columns=["age_band"], errors="ignore")
-    freq_out = OUT_DIR / "claim_frequency.parquet"
-    freq_save.to_parquet(freq_out, index=False)
-    print(f"\n  Saved: {freq_out}")
+    freq_out = OUT_DIR / "claim_frequency"
+    write_partitioned(freq_save, freq_out, ["Region"])
+    print(f"\n  Saved: {freq_out}/ (hive-partitioned by Region)")
 
     sev_out = OUT_DIR / "claim_severity.parquet"
-    sev.to_parquet(sev_out, index=False)
+    write_processed(sev, sev_out)
     print(f"  Saved: {sev_out}")
 
     age_out = OUT_DIR / "claim_freq_by_age.parquet"
-    age_stats.to_parquet(age_out, index=False)
+    write_processed(age_stats, age_out)
     print(f"  Saved: {age_out}")
 
     return {"frequency": freq, "severity": sev, "by_age": age_stats}
@@ -10,11 +10,30 @@ Output: data/processed/motoring_convictions.parquet
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from processors import write_processed
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
 
+def _extract_label(col: pd.Series, lower: bool = False) -> pd.Series:
+    """Pull the text after 'Prefix: ' out of a column, trimmed.
+
+    One batched Arrow regex/trim/lower pipeline instead of three chained
+    pandas .str operations that each rescan the column.
+    """
+    v = pc.struct_field(
+        pc.extract_regex(pa.array(col, from_pandas=True), pattern=r":\s*(?P<v>.*)"),
+        "v")
+    v = pc.utf8_trim_whitespace(v)
+    if lower:
+        v = pc.utf8_lower(v)
+    return pd.Series(v.to_numpy(zero_copy_only=False), index=col.index)
+
+
 def process() -> pd.DataFrame:
     """Parse motoring convictions CSV → offence type and demographic distributions."""
     fpath = RAW_DIR / "motoring_convictions_2017_2024.csv"
@@ -32,8 +51,8 @@ def process() -> pd.DataFrame:
         df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
 
     # Clean sex and age
-    df["sex"] = df["Sex"].str.extract(r":\s*(.*)", expand=False).str.strip().str.lower()
-    df["age_range"] = df["Age Range"].str.extract(r":\s*(.*)", expand=False).str.strip()
+    df["sex"] = _extract_label(df["Sex"], lower=True)
+    df["age_range"] = _extract_label(df["Age Range"])
 
     # ── Offence group distribution (convicted) ──
     offence_dist = (
@@ -87,12 +106,12 @@ def process() -> pd.DataFrame:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     out_path = OUT_DIR / "motoring_convictions.parquet"
-    offence_detail.to_parquet(out_path, index=False)
+    write_processed(offence_detail, out_path)
     print(f"\n  Saved: {out_path}")
 
     # Also save the full year's data for cross-tabs
     full_out = OUT_DIR / "motoring_convictions_full.parquet"
-    df.to_parquet(full_out, index=False)
+    write_processed(df, full_out)
     print(f"  Saved: {full_out}")
 
     return offence_detail
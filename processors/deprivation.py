@@ -10,6 +10,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from processors import write_processed
+
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
@@ -17,7 +19,8 @@ OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 def process() -> pd.DataFrame:
     """Parse IoD2019 XLSX into clean LSOA-level IMD table."""
     fpath = RAW_DIR / "File_1_-_IMD2019_Index_of_Multiple_Deprivation.xlsx"
-    df = pd.read_excel(fpath, sheet_name="IMD2019")
+    # calamine: Rust XLSX parser — the read dominates this processor's runtime
+    df = pd.read_excel(fpath, sheet_name="IMD2019", engine="calamine")
 
     print(f"  Columns: {df.columns.tolist()[:10]}")
     print(f"  {len(df):,} LSOAs")
@@ -51,7 +54,7 @@ def process() -> pd.DataFrame:
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUT_DIR / "imd_by_lsoa.parquet"
-    df.to_parquet(out_path, index=False)
+    write_processed(df, out_path)
     print(f"  Saved: {out_path}")
 
     return df
@@ -9,35 +9,37 @@ Output: data/processed/driver_age_gender.parquet
 from pathlib import Path
 
 import pandas as pd
+from python_calamine import CalamineWorkbook
+
+from processors import write_processed
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
+SHEET = "DRL0101- November 2025"
+
 
 def process() -> pd.DataFrame:
     """Parse DRL0101 sheet: licence holders by single year of age and sex."""
     fpath = RAW_DIR / "driving-licence-data-nov-2025.xlsx"
-    df = pd.read_excel(fpath, sheet_name="DRL0101- November 2025", header=None)
 
-    # Find the header row (contains "Provisional Licences - Male")
+    # Find the header row (contains "Provisional Licences - Male") by
+    # streaming rows — no full-sheet DataFrame just to locate one cell
+    sheet = CalamineWorkbook.from_path(fpath).get_sheet_by_name(SHEET)
     header_idx = None
-    for i, row in df.iterrows():
-        vals = [str(v) for v in row.values]
-        if any("Provisional Licences - Male" in v for v in vals):
+    for i, row in enumerate(sheet.iter_rows()):
+        if any("Provisional Licences - Male" in str(v) for v in row):
             header_idx = i
             break
     if header_idx is None:
         raise ValueError("Could not find header row in DRL0101")
 
-    # Next row should be "Age" label, data starts after that
-    data_start = header_idx + 2  # skip header + "Age" label row
+    # Next row should be "Age" label, data starts after that; read only
+    # the seven columns we keep
     headers = ["age", "prov_male", "prov_female", "prov_total",
                "full_male", "full_female", "full_total"]
-
-    data = df.iloc[data_start:].copy()
-    data.columns = range(len(data.columns))
-    data = data.iloc[:, :7]
-    data.columns = headers
+    data = pd.read_excel(fpath, sheet_name=SHEET, engine="calamine", header=None,
+                         skiprows=header_idx + 2, usecols=range(7), names=headers)
 
     # Convert age to numeric, drop non-numeric rows (totals, notes)
     data["age"] = pd.to_numeric(data["age"], errors="coerce")
@@ -64,7 +66,7 @@ def process() -> pd.DataFrame:
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUT_DIR / "driver_age_gender.parquet"
-    data.to_parquet(out_path, index=False)
+    write_processed(data, out_path)
     print(f"  Saved: {out_path}")
 
     return data
@@ -6,10 +6,14 @@ Output: data/processed/marital_status.parquet
         — columns: sex, age_group, status, count, weight
 """
 
+import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from processors import find_header_row, write_processed
+
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
@@ -44,25 +48,26 @@ STATUS_PREFIX_MAP = {
     "Widowed": "widowed",
 }
 
+# One alternation, longest-first so "Never married" can never lose to "Married"
+_STATUS_RE = re.compile(
+    "^(" + "|".join(re.escape(p) for p in sorted(STATUS_PREFIX_MAP, key=len, reverse=True)) + ")"
+)
+
 
 def _parse_sheet(fpath: Path, sheet_name: str, sex_label: str) -> pd.DataFrame:
     """Parse one marital status sheet (All/Males/Females)."""
-    df = pd.read_excel(fpath, sheet_name=sheet_name, header=None)
-
-    # Find header row containing "Marital status"
-    header_idx = None
-    for i, row in df.iterrows():
-        vals = [str(v) for v in row.values]
-        has_status = any("Marital status" in v for v in vals)
-        has_estimate = any("Estimate" in v for v in vals)
-        if has_status and has_estimate:
-            header_idx = i
-            break
-    if header_idx is None:
-        raise ValueError(f"Could not find header row in {sheet_name}")
-
-    data = df.iloc[header_idx + 1:].copy()
-    data.columns = [str(c) for c in df.iloc[header_idx].tolist()]
+    # Locate the header row ("Marital status" + "Estimate") by streaming
+    # raw rows, then parse only the sheet from the header down — the title
+    # and notes rows above it are never turned into a DataFrame
+    header_idx = find_header_row(
+        fpath, sheet_name,
+        lambda row: any("Marital status" in str(v) for v in row)
+        and any("Estimate" in str(v) for v in row))
+    df = pd.read_excel(fpath, sheet_name=sheet_name, header=None,
+                       skiprows=header_idx, engine="calamine")
+
+    data = df.iloc[1:].copy()
+    data.columns = [str(c) for c in df.iloc[0].tolist()]
 
     # We want the latest year's Estimate column (2024)
     # Columns repeat as: 'YYYY Estimate', 'YYYY CV', 'YYYY CI+/-'
@@ -81,15 +86,13 @@ def _parse_sheet(fpath: Path, sheet_name: str, sex_label: str) -> pd.DataFrame:
     result = data[[status_col, age_col, latest_est]].copy()
     result.columns = ["status_raw", "age_group", "count"]
 
-    # Map status using prefix matching (ONS data has trailing spaces and [note N] annotations)
-    def _map_status(raw: str) -> str | None:
-        raw_stripped = str(raw).strip()
-        for prefix, mapped in STATUS_PREFIX_MAP.items():
-            if raw_stripped.startswith(prefix):
-                return mapped
-        return None
-
-    result["status"] = result["status_raw"].apply(_map_status)
+    # Map status using prefix matching (ONS data has trailing spaces and
+    # [note N] annotations) — one vectorized regex pass instead of a Python
+    # function call per row
+    result["status"] = (
+        result["status_raw"].astype(str).str.strip()
+        .str.extract(_STATUS_RE, expand=False).map(STATUS_PREFIX_MAP)
+    )
     result = result.dropna(subset=["status"])
     result = result[result["age_group"].isin(AGE_GROUP_MAP.keys())]
     result["count"] = pd.to_numeric(result["count"], errors="coerce").fillna(0)
@@ -112,9 +115,9 @@ def process() -> pd.DataFrame:
     df["age_max"] = df["age_group"].map(lambda x: AGE_GROUP_MAP.get(x, (0, 0))[1])
 
     # Compute within-group weights (probability of each status given age+sex)
-    df["weight"] = df.groupby(["sex", "age_group"])["count"].transform(
-        lambda x: x / x.sum() if x.sum() > 0 else 0
-    )
+    # via the C-path "sum" transform — no Python callback per group
+    totals = df.groupby(["sex", "age_group"])["count"].transform("sum")
+    df["weight"] = np.where(totals > 0, df["count"] / totals.where(totals > 0, 1), 0.0)
 
     print(f"  {len(df)} rows (sex × age_group × status)")
     print(f"  Status distribution (all):")
@@ -124,7 +127,7 @@ def process() -> pd.DataFrame:
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUT_DIR / "marital_status.parquet"
-    df.to_parquet(out_path, index=False)
+    write_processed(df, out_path)
     print(f"  Saved: {out_path}")
 
     return df
@@ -9,11 +9,15 @@ Output: data/processed/mot_mileage_by_age.parquet
 """
 
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
+import pyarrow as pa
+import pyarrow.csv as pv
+
+from processors import write_processed
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
@@ -21,108 +25,240 @@ OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 # Only use complete monthly files (Jul-Sep 2024); Dec is truncated
 COMPLETE_MONTHS = ["test_result_202407.csv", "test_result_202408.csv", "test_result_202409.csv"]
 
-KEEP_COLS = ["test_mileage", "make", "model", "fuel_type", "first_use_date", "test_date", "test_result"]
+SCAN_COLS = ["test_mileage", "make", "fuel_type", "first_use_date", "test_date"]
+
+# Explicit Arrow schema: numerics and dates are parsed in the same pass as
+# tokenization, and the high-repetition make/fuel columns come back
+# dictionary-encoded instead of as millions of Python strings
+COLUMN_TYPES = {
+    "test_mileage": pa.int32(),
+    "test_date": pa.timestamp("s"),
+    "first_use_date": pa.timestamp("s"),
+    "make": pa.dictionary(pa.int32(), pa.string()),
+    "fuel_type": pa.dictionary(pa.int32(), pa.string()),
+}
+
+# Filter bounds (MOT applies from 3 years; above 30 the data is sparse/noisy)
+MIN_AGE, MAX_AGE = 3, 30
+MIN_MILEAGE, MAX_MILEAGE = 100, 300_000
+
+# Annual-mileage histograms are binned at 10 mi/yr per make (exact per fuel
+# type) — far finer than the summary prints that consume them
+_MAKE_BIN = 10
+_MAX_ANNUAL = MAX_MILEAGE // MIN_AGE
+
+
+def _new_accumulators() -> dict:
+    """Per-scan partial aggregates, mergeable across monthly files.
+
+    test_mileage is a bounded integer, so a (vehicle_age × mileage) count
+    matrix is an exact sufficient statistic for every per-age aggregate we
+    publish — means, stds and interpolated quantiles all fall out of it.
+    Peak memory is O(histogram), not O(rows), regardless of how many months
+    are scanned.
+    """
+    return {
+        "rows": 0,
+        "hist": np.zeros((MAX_AGE + 1, MAX_MILEAGE + 1), dtype=np.int64),
+        "fuel_odo": {},     # fuel → mileage histogram
+        "fuel_annual": {},  # fuel → annual-mileage histogram (1 mi/yr bins)
+        "make_annual": {},  # make → annual-mileage histogram (_MAKE_BIN bins)
+    }
+
+
+def _group_rows(arr: pa.Array, sel: np.ndarray):
+    """Yield (dictionary value, row positions) for the rows selected by `sel`."""
+    codes = arr.indices.fill_null(-1).to_numpy()[sel]
+    names = arr.dictionary.to_pylist()
+    order = np.argsort(codes, kind="stable")
+    uniq, starts = np.unique(codes[order], return_index=True)
+    bounds = np.append(starts, len(order))
+    for i, code in enumerate(uniq):
+        if code >= 0:  # -1 = null entry, dropped (matches groupby semantics)
+            yield names[code], order[bounds[i]:bounds[i + 1]]
+
+
+def _accumulate(acc: dict, batch: pa.RecordBatch) -> None:
+    """Fold one Arrow record batch into the running aggregates."""
+    acc["rows"] += batch.num_rows
+    mile = batch.column("test_mileage").to_numpy(zero_copy_only=False)
+    test_d = batch.column("test_date").to_numpy(zero_copy_only=False)
+    first_d = batch.column("first_use_date").to_numpy(zero_copy_only=False)
+
+    ok = (
+        ~np.isnan(mile) & (mile >= MIN_MILEAGE) & (mile <= MAX_MILEAGE)
+        & ~np.isnat(test_d) & ~np.isnat(first_d)
+    )
+    days = (test_d[ok].astype("datetime64[D]")
+            - first_d[ok].astype("datetime64[D]")).astype(np.int64)
+    # round(days / 365.25) == (4*days + 730) // 1461: integer-only, no
+    # float64 divide/round passes (exact — d/365.25 can never land on .5)
+    age = (4 * days + 730) // 1461
+    keep = (age >= MIN_AGE) & (age <= MAX_AGE)
+    age = age[keep]
+    mile_i = mile[ok][keep].astype(np.int64)
+    np.add.at(acc["hist"], (age, mile_i), 1)
+
+    annual = np.rint(mile_i / age).astype(np.int64)
+    sel = np.flatnonzero(ok)[keep]
+    for fuel, rows in _group_rows(batch.column("fuel_type"), sel):
+        if fuel not in acc["fuel_odo"]:
+            acc["fuel_odo"][fuel] = np.zeros(MAX_MILEAGE + 1, dtype=np.int64)
+            acc["fuel_annual"][fuel] = np.zeros(_MAX_ANNUAL + 1, dtype=np.int64)
+        np.add.at(acc["fuel_odo"][fuel], mile_i[rows], 1)
+        np.add.at(acc["fuel_annual"][fuel], annual[rows], 1)
+    for make, rows in _group_rows(batch.column("make"), sel):
+        if make not in acc["make_annual"]:
+            acc["make_annual"][make] = np.zeros(
+                _MAX_ANNUAL // _MAKE_BIN + 1, dtype=np.int64)
+        np.add.at(acc["make_annual"][make],
+                  np.rint(annual[rows] / _MAKE_BIN).astype(np.int64), 1)
+
+
+def _scan_file(fpath: Path) -> dict:
+    """Stream one monthly CSV batch-by-batch into fresh accumulators."""
+    acc = _new_accumulators()
+    with pv.open_csv(
+        fpath,
+        read_options=pv.ReadOptions(block_size=64 << 20),
+        convert_options=pv.ConvertOptions(
+            include_columns=SCAN_COLS, column_types=COLUMN_TYPES),
+    ) as reader:
+        for batch in reader:
+            _accumulate(acc, batch)
+    return acc
+
+
+def _merge(acc: dict, other: dict) -> None:
+    """Fold one file's partial aggregates into the running totals."""
+    acc["rows"] += other["rows"]
+    acc["hist"] += other["hist"]
+    for key in ("fuel_odo", "fuel_annual", "make_annual"):
+        for name, hist in other[key].items():
+            if name in acc[key]:
+                acc[key][name] += hist
+            else:
+                acc[key][name] = hist
+
+
+def _hist_quantile(hist: np.ndarray, q: float) -> float:
+    """Exact linear-interpolated quantile (pandas default) of a histogram."""
+    cum = np.cumsum(hist)
+    pos = q * (cum[-1] - 1)
+    lo = int(np.searchsorted(cum, np.floor(pos), side="right"))
+    hi = int(np.searchsorted(cum, np.ceil(pos), side="right"))
+    return lo + (hi - lo) * (pos - np.floor(pos))
+
+
+def _hist_stats(hist: np.ndarray) -> tuple:
+    """(count, mean, std, p25, median, p75) of an integer-value histogram."""
+    n = int(hist.sum())
+    vals = np.arange(hist.size, dtype=np.float64)
+    s = float(hist @ vals)
+    ss = float(hist @ (vals * vals))
+    mean = s / n
+    std = np.sqrt((ss - n * mean * mean) / (n - 1)) if n > 1 else np.nan
+    return (n, mean, std, _hist_quantile(hist, 0.25),
+            _hist_quantile(hist, 0.5), _hist_quantile(hist, 0.75))
 
 
 def process() -> pd.DataFrame:
     """Parse MOT test CSVs → mileage distributions by vehicle age."""
     mot_dir = RAW_DIR / "mot" / "MOT testing data results (2024)"
 
-    chunks = []
+    fpaths = []
     for fname in COMPLETE_MONTHS:
         fpath = mot_dir / fname
         if not fpath.exists():
             print(f"  WARNING: {fpath} not found, skipping")
             continue
         print(f"  Reading {fname}...")
-        df = pd.read_csv(fpath, usecols=KEEP_COLS, low_memory=False, dtype=str)
-        chunks.append(df)
+        fpaths.append(fpath)
 
-    df = pd.concat(chunks, ignore_index=True)
-    print(f"  {len(df):,} total MOT test records (3 months)")
+    # The monthly scans are independent and both the Arrow CSV reader and
+    # the numpy folds release the GIL, so the files are scanned
+    # concurrently, each thread filling its own accumulators
+    acc = _new_accumulators()
+    with ThreadPoolExecutor(max_workers=max(len(fpaths), 1)) as ex:
+        for part in ex.map(_scan_file, fpaths):
+            _merge(acc, part)
 
-    # Convert types (all read as str to avoid Arrow backend issues)
-    df["test_mileage"] = pd.to_numeric(df["test_mileage"], errors="coerce")
-    df["first_use_date"] = pd.to_datetime(df["first_use_date"], errors="coerce")
-    df["test_date"] = pd.to_datetime(df["test_date"].str[:10], errors="coerce")
-
-    # Filter: valid mileage and dates
-    df = df[df["test_mileage"].notna() & (df["test_mileage"] > 0)]
-    df = df[df["first_use_date"].notna() & df["test_date"].notna()]
-
-    # Compute vehicle age at test (years)
-    df["vehicle_age"] = ((df["test_date"] - df["first_use_date"]).dt.days / 365.25).round(0).astype(int)
-
-    # Filter reasonable values
-    df = df[(df["vehicle_age"] >= 3) & (df["vehicle_age"] <= 30)]  # MOT from 3 years
-    df = df[(df["test_mileage"] >= 100) & (df["test_mileage"] <= 300_000)]
-
-    print(f"  {len(df):,} records after filtering (age 3-30, mileage 100-300K)")
+    print(f"  {acc['rows']:,} total MOT test records (3 months)")
+    n_kept = int(acc["hist"].sum())
+    print(f"  {n_kept:,} records after filtering (age 3-30, mileage 100-300K)")
 
     # ── Odometer mileage by vehicle age ──
-    odo_by_age = df.groupby("vehicle_age")["test_mileage"].agg(
-        mean_mileage="mean",
-        median_mileage="median",
-        std_mileage="std",
-        p25_mileage=lambda x: x.quantile(0.25),
-        p75_mileage=lambda x: x.quantile(0.75),
-        count="count",
-    ).reset_index()
+    # Annual mileage ≈ odometer / age (crude but useful); within an age
+    # bucket it is a fixed rescaling of the odometer, so its mean/median/std
+    # come from the same histogram
+    odo_rows, annual_rows = [], []
+    for age in range(MIN_AGE, MAX_AGE + 1):
+        hist = acc["hist"][age]
+        if not hist.any():
+            continue
+        n, mean, std, p25, median, p75 = _hist_stats(hist)
+        odo_rows.append((age, mean, median, std, p25, p75, n))
+        annual_rows.append((age, mean / age, median / age, std / age))
+
+    odo_by_age = pd.DataFrame(odo_rows, columns=[
+        "vehicle_age", "mean_mileage", "median_mileage", "std_mileage",
+        "p25_mileage", "p75_mileage", "count"])
+    annual_by_age = pd.DataFrame(annual_rows, columns=[
+        "vehicle_age", "mean_annual", "median_annual", "std_annual"])
 
+    # itertuples: plain tuples per row, no per-iteration Series boxing
     print(f"\n  Odometer mileage by vehicle age:")
-    for _, row in odo_by_age.iterrows():
-        age = int(row["vehicle_age"])
+    for age, _, median, _, p25, p75, n in odo_by_age.itertuples(index=False, name=None):
+        age = int(age)
         if age <= 15 or age % 5 == 0:
-            print(f"    Age {age:2d}: median {row['median_mileage']:>8,.0f} mi "
-                  f"(IQR {row['p25_mileage']:>7,.0f}–{row['p75_mileage']:>7,.0f}), n={int(row['count']):,}")
-
-    # ── Estimate annual mileage by vehicle age ──
-    # Annual mileage ≈ odometer / age (crude but useful)
-    df["annual_mileage_est"] = df["test_mileage"] / df["vehicle_age"]
-    annual_by_age = df.groupby("vehicle_age")["annual_mileage_est"].agg(
-        mean_annual="mean",
-        median_annual="median",
-        std_annual="std",
-    ).reset_index()
+            print(f"    Age {age:2d}: median {median:>8,.0f} mi "
+                  f"(IQR {p25:>7,.0f}–{p75:>7,.0f}), n={int(n):,}")
 
     print(f"\n  Estimated annual mileage by vehicle age:")
-    for _, row in annual_by_age.iterrows():
-        age = int(row["vehicle_age"])
+    for age, _, median, _ in annual_by_age.itertuples(index=False, name=None):
+        age = int(age)
         if age <= 15 or age % 5 == 0:
-            print(f"    Age {age:2d}: median {row['median_annual']:>7,.0f} mi/yr")
+            print(f"    Age {age:2d}: median {median:>7,.0f} mi/yr")
 
     # ── Mileage by fuel type ──
-    fuel_mileage = df.groupby("fuel_type").agg(
-        median_mileage=("test_mileage", "median"),
-        median_annual=("annual_mileage_est", "median"),
-        count=("test_mileage", "count"),
-    ).sort_values("count", ascending=False)
+    fuel_mileage = pd.DataFrame(
+        {
+            fuel: (_hist_quantile(odo, 0.5),
+                   _hist_quantile(acc["fuel_annual"][fuel], 0.5),
+                   int(odo.sum()))
+            for fuel, odo in acc["fuel_odo"].items()
+        },
+        index=["median_mileage", "median_annual", "count"],
+    ).T.sort_values("count", ascending=False)
 
     print(f"\n  Mileage by fuel type:")
-    for fuel, row in fuel_mileage.iterrows():
-        if row["count"] > 1000:
-            print(f"    {fuel}: median odo {row['median_mileage']:>8,.0f}, "
-                  f"annual {row['median_annual']:>7,.0f}, n={row['count']:,}")
+    for fuel, median_odo, median_ann, n in fuel_mileage.itertuples(name=None):
+        if n > 1000:
+            print(f"    {fuel}: median odo {median_odo:>8,.0f}, "
+                  f"annual {median_ann:>7,.0f}, n={int(n):,}")
 
     # ── Top makes by median mileage ──
-    make_mileage = df.groupby("make").agg(
-        median_annual=("annual_mileage_est", "median"),
-        count=("test_mileage", "count"),
-    ).sort_values("count", ascending=False)
+    make_mileage = pd.DataFrame(
+        {
+            make: (_hist_quantile(hist, 0.5) * _MAKE_BIN, int(hist.sum()))
+            for make, hist in acc["make_annual"].items()
+        },
+        index=["median_annual", "count"],
+    ).T.sort_values("count", ascending=False)
 
     print(f"\n  Top 10 makes by volume — median annual mileage:")
-    for make, row in make_mileage.head(10).iterrows():
-        print(f"    {make}: {row['median_annual']:>7,.0f} mi/yr (n={row['count']:,})")
+    for make, median_ann, n in make_mileage.head(10).itertuples(name=None):
+        print(f"    {make}: {median_ann:>7,.0f} mi/yr (n={int(n):,})")
 
     # ── Save ──
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     out1 = OUT_DIR / "mot_mileage_by_age.parquet"
-    odo_by_age.to_parquet(out1, index=False)
+    write_processed(odo_by_age, out1)
     print(f"\n  Saved: {out1}")
 
     out2 = OUT_DIR / "mot_annual_mileage_by_age.parquet"
-    annual_by_age.to_parquet(out2, index=False)
+    write_processed(annual_by_age, out2)
     print(f"  Saved: {out2}")
 
     return odo_by_age
@@ -10,26 +10,25 @@ from pathlib import Path
 
 import pandas as pd
 
+from processors import find_header_row, write_processed
+
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
 
 def _parse_names_sheet(fpath: Path, sex: str) -> pd.DataFrame:
     """Parse an ONS baby names Excel file. Table_1 = top 100 for latest year."""
-    df = pd.read_excel(fpath, sheet_name="Table_1", header=None)
-
-    # Find the header row containing "Rank" and "Name"
-    header_idx = None
-    for i, row in df.iterrows():
-        vals = [str(v).strip() for v in row.values]
-        if "Rank" in vals and "Name" in vals:
-            header_idx = i
-            break
-    if header_idx is None:
-        raise ValueError(f"Could not find header row in {fpath}")
-
-    data = df.iloc[header_idx + 1:].copy()
-    data.columns = df.iloc[header_idx].tolist()
+    # Locate the header row ("Rank" + "Name") by streaming raw rows, then
+    # parse only the sheet from the header down — the title rows above it
+    # are never turned into a DataFrame
+    header_idx = find_header_row(
+        fpath, "Table_1",
+        lambda row: {"Rank", "Name"} <= {str(v).strip() for v in row})
+    df = pd.read_excel(fpath, sheet_name="Table_1", header=None,
+                       skiprows=header_idx, engine="calamine")
+
+    data = df.iloc[1:].copy()
+    data.columns = df.iloc[0].tolist()
 
     # Keep Rank, Name, Count
     data = data[["Rank", "Name", "Count"]].copy()
@@ -63,7 +62,7 @@ def process() -> pd.DataFrame:
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUT_DIR / "baby_names.parquet"
-    df.to_parquet(out_path, index=False)
+    write_processed(df, out_path)
     print(f"  Saved: {out_path}")
 
     return df
@@ -6,13 +6,20 @@ Output: data/processed/occupation_dist.parquet
         — columns: soc_code, soc_name, soc_level, sex, count, weight
 """
 
+import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from processors import write_processed
+
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 
+# "1111 : Chief executives..." → code and name in one compiled pass
+_SOC_RE = re.compile(r"^(\d+)\s*:\s*(.*)")
+
 
 def process() -> pd.DataFrame:
     """Parse Nomis APS occupation CSV → occupation frequency by sex."""
@@ -22,10 +29,14 @@ def process() -> pd.DataFrame:
     # Rename columns
     df.columns = ["date", "sex", "soc_full", "value"]
 
-    # Parse SOC code and name from soc_full (format: "1111 : Chief executives...")
-    df = df[df["soc_full"].str.contains(":", na=False)].copy()
-    df["soc_code"] = df["soc_full"].str.extract(r"^(\d+)", expand=False)
-    df["soc_name"] = df["soc_full"].str.extract(r":\s*(.*)", expand=False).str.strip()
+    # Parse SOC code and name from soc_full in one regex pass; rows that
+    # don't match (summary lines like "All occupations") extract as NaN
+    # and are dropped, which the contains filter + two extracts did in
+    # three traversals
+    extracted = df["soc_full"].str.extract(_SOC_RE)
+    df["soc_code"] = extracted[0]
+    df["soc_name"] = extracted[1].str.strip()
+    df = df.dropna(subset=["soc_code"]).copy()
     df["soc_level"] = df["soc_code"].str.len()  # 1=major, 2=sub-major, 3=minor, 4=unit
 
     # Convert value to numeric
@@ -41,13 +52,12 @@ def process() -> pd.DataFrame:
     df_unit["sex"] = df_unit["sex"].map(sex_map)
     df_major["sex"] = df_major["sex"].map(sex_map)
 
-    # For each sex, compute weights
+    # Within-sex weights via one C-path transform per table instead of a
+    # Python loop over sexes with repeated .loc masked writes
     for subset in [df_unit, df_major]:
-        for sex in ["all", "male", "female"]:
-            mask = subset["sex"] == sex
-            total = subset.loc[mask, "value"].sum()
-            if total > 0:
-                subset.loc[mask, "weight"] = subset.loc[mask, "value"] / total
+        totals = subset.groupby("sex")["value"].transform("sum")
+        subset["weight"] = np.where(
+            totals > 0, subset["value"] / totals.where(totals > 0, 1), np.nan)
 
     # Combine
     result = pd.concat([df_major, df_unit], ignore_index=True)
@@ -65,12 +75,12 @@ def process() -> pd.DataFrame:
     # Show top 10 occupations
     top10 = result[(result["sex"] == "all") & (result["soc_level"] == 4)].nlargest(10, "count")
     print(f"  Top 10 occupations (all persons):")
-    for _, row in top10.iterrows():
-        print(f"    {row['soc_code']} {row['soc_name']}: {row['count']:,.0f} ({row['weight']:.1%})")
+    for soc_code, soc_name, _, _, count, weight in top10.itertuples(index=False, name=None):
+        print(f"    {soc_code} {soc_name}: {count:,.0f} ({weight:.1%})")
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUT_DIR / "occupation_dist.parquet"
-    result.to_parquet(out_path, index=False)
+    write_processed(result, out_path)
     print(f"  Saved: {out_path}")
 
     return result
@@ -9,8 +9,14 @@ Output: data/processed/postcode_lookup.parquet
 import glob
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+
+from processors import write_processed
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
@@ -35,8 +41,22 @@ REGION_MAP = {
     "N99999999": "Northern Ireland",
 }
 
-# Columns we keep from each ONSPD file
-KEEP_COLS = ["pcd", "oslaua", "ru11ind", "imd", "lat", "long", "lsoa11", "rgn", "ctry", "doterm"]
+# Columns we keep from each ONSPD file, with their scan types: numerics
+# parse during CSV tokenization (no re-parse pass afterwards) and the
+# low-cardinality admin-geography columns arrive dictionary-encoded
+COLUMN_TYPES = {
+    "pcd": pa.string(),
+    "oslaua": pa.dictionary(pa.int32(), pa.string()),
+    "ru11ind": pa.dictionary(pa.int32(), pa.string()),
+    "imd": pa.float32(),
+    "lat": pa.float32(),
+    "long": pa.float32(),
+    "lsoa11": pa.string(),
+    "rgn": pa.dictionary(pa.int32(), pa.string()),
+    "ctry": pa.dictionary(pa.int32(), pa.string()),
+    "doterm": pa.string(),
+}
+KEEP_COLS = list(COLUMN_TYPES)
 
 
 def process() -> pd.DataFrame:
@@ -46,29 +66,59 @@ def process() -> pd.DataFrame:
     if not files:
         raise FileNotFoundError(f"No ONSPD CSVs found in {csv_dir}")
 
-    chunks = []
-    for f in tqdm(files, desc="Reading ONSPD files"):
-        df = pd.read_csv(f, usecols=KEEP_COLS, dtype=str, low_memory=False)
-        # Keep only live postcodes (doterm is empty = still active)
-        df = df[df["doterm"].isna() | (df["doterm"] == "")]
-        df = df.drop(columns=["doterm"])
-        chunks.append(df)
-
-    print(f"  Concatenating {len(chunks)} postcode-area files...")
-    df = pd.concat(chunks, ignore_index=True)
-
-    # Clean up
-    df["pcd"] = df["pcd"].str.strip()
-    df["pcd_area"] = df["pcd"].str.extract(r"^([A-Z]{1,2})", expand=False)
-
-    # Map region codes to names
-    df["rgn_name"] = df["rgn"].map(REGION_MAP).fillna("Unknown")
-
-    # Convert numeric columns
-    df["imd"] = pd.to_numeric(df["imd"], errors="coerce")
-    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
-    df["lon"] = pd.to_numeric(df["long"], errors="coerce")
-    df = df.drop(columns=["long"])
+    # One multithreaded Arrow scan across all ~120 area files: the live-
+    # postcode filter (doterm empty = still active) and the column
+    # projection are pushed down into the CSV scan, and the result arrives
+    # as a single table with no per-file DataFrame concat
+    # (the scanner pushes the to_table column selection into the CSV
+    # conversion itself, so unused ONSPD columns are tokenized but never
+    # converted to Arrow arrays)
+    fmt = ds.CsvFileFormat(
+        convert_options=pv.ConvertOptions(
+            column_types=COLUMN_TYPES,
+            # empty CSV fields are missing values, as in the pandas reader
+            strings_can_be_null=True))
+    print(f"  Scanning {len(files)} postcode-area files...")
+    tbl = ds.dataset(files, format=fmt).to_table(
+        columns=[c for c in KEEP_COLS if c != "doterm"],
+        filter=ds.field("doterm").is_null() | (ds.field("doterm") == ""),
+    )
+    # dictionary columns land as pandas Categoricals (round-trippable in
+    # parquet, unlike ArrowDtype dictionaries); everything else stays
+    # Arrow-backed
+    df = tbl.to_pandas(
+        types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t))
+
+    # Clean up + area prefix with Arrow kernels: the trim and the RE2-based
+    # extract run over the string buffers directly (no backtracking, no
+    # per-row Python regex machinery)
+    pcd = pc.utf8_trim_whitespace(pa.array(df["pcd"]))
+    area = pc.struct_field(
+        pc.extract_regex(pcd, pattern=r"^(?P<area>[A-Z]{1,2})"), "area")
+    df["pcd"] = pd.arrays.ArrowExtensionArray(pcd)
+    df["pcd_area"] = pd.arrays.ArrowExtensionArray(area)
+
+    # Map region codes to names on the dictionary index (a dozen values)
+    # rather than hashing every row through the dict: the scan already
+    # delivered rgn dictionary-encoded, so only its codes are touched.
+    # Several codes share a target name ("Scotland", "Unknown"), so
+    # rgn_name is rebuilt from recoded integer codes — rename_categories
+    # would reject the duplicate targets
+    rgn = tbl.column("rgn").combine_chunks()
+    codes = rgn.indices.fill_null(-1).to_numpy()
+    cats = rgn.dictionary.to_pylist()
+    names = [REGION_MAP.get(c, "Unknown") for c in cats]
+    uniq = list(dict.fromkeys(names + ["Unknown"]))
+    recode = np.array([uniq.index(n) for n in names] + [uniq.index("Unknown")])
+    df["rgn"] = pd.Categorical.from_codes(codes, categories=cats)
+    # null/unmapped rgn codes carry code -1, which indexes the trailing
+    # "Unknown" slot of the recode table
+    df["rgn_name"] = pd.Categorical.from_codes(recode[codes], categories=uniq)
+
+    # Numerics were already parsed (as float32 — lossless for IMD ranks
+    # below 2^24, ~1 cm for coordinates) by the scan; only the ONSPD
+    # "long" name needs changing
+    df = df.rename(columns={"long": "lon"})
 
     # Filter to GB only (exclude Channel Islands, Isle of Man — ctry not E/W/S/N)
     df = df[df["ctry"].isin(["E92000001", "W92000004", "S92000003", "N92000002"])]
@@ -79,11 +129,16 @@ def process() -> pd.DataFrame:
 
     # IMD decile (1=most deprived, 10=least deprived) — ranks go up to ~32,844
     # Only England has IMD in ONSPD; for Scotland/Wales/NI we'll leave as NaN
+    # ceil(rank / max * 10) reproduces pd.cut's decile edges exactly in one
+    # fused numpy pass (clip pins rank 0 to decile 1, as include_lowest
+    # did), with a nullable int8 result instead of an interval Categorical
     max_imd = 32844
-    df["imd_decile"] = pd.cut(
-        df["imd"], bins=[0] + [max_imd * i / 10 for i in range(1, 11)],
-        labels=range(1, 11), include_lowest=True
-    ).astype("Int64")
+    imd = df["imd"].to_numpy(dtype="float32", na_value=np.nan)
+    missing = np.isnan(imd)
+    with np.errstate(invalid="ignore"):
+        dec = np.clip(np.ceil(imd / max_imd * 10), 1, 10)
+    df["imd_decile"] = pd.arrays.IntegerArray(
+        np.where(missing, 0, dec).astype("int8"), mask=missing)
 
     # Urban/rural classification (simplify)
     # A1/B1/C1/C2 = Urban, D1/D2/E1/E2/F1/F2 = Rural
@@ -94,18 +149,16 @@ def process() -> pd.DataFrame:
     df = df[["pcd", "pcd_area", "rgn", "rgn_name", "oslaua", "lsoa11",
              "ru11ind", "is_urban", "imd", "imd_decile", "lat", "lon"]]
 
-    # Compact types
+    # Compact types (rgn/rgn_name are already categorical from the mapping)
     df["pcd"] = df["pcd"].astype("category")
     df["pcd_area"] = df["pcd_area"].astype("category")
-    df["rgn"] = df["rgn"].astype("category")
-    df["rgn_name"] = df["rgn_name"].astype("category")
 
     print(f"  {len(df):,} live postcodes retained")
     print(f"  Regions: {df['rgn_name'].value_counts().to_dict()}")
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUT_DIR / "postcode_lookup.parquet"
-    df.to_parquet(out_path, index=False)
+    write_processed(df, out_path)
     print(f"  Saved: {out_path} ({out_path.stat().st_size / 1024 / 1024:.1f} MB)")
 
     return df
@@ -9,6 +9,11 @@ Output: data/processed/vehicle_make_model.parquet
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+
+from processors import write_processed
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
@@ -17,7 +22,11 @@ OUT_DIR = Path(__file__).parent.parent / "data" / "processed"
 def process() -> pd.DataFrame:
     """Parse VEH0120: licensed vehicles by make/model/fuel, latest quarter."""
     fpath = RAW_DIR / "df_VEH0120_UK.csv"
-    df = pd.read_csv(fpath, low_memory=False, encoding="latin-1")
+    # Arrow's CSV reader is multi-threaded and SIMD-tokenized — much faster
+    # than pandas on this 37 MB file
+    df = pv.read_csv(
+        fpath, read_options=pv.ReadOptions(encoding="latin-1")
+    ).to_pandas()
 
     # Keep only Cars, Licensed status, latest quarter
     df = df[df["BodyType"] == "Cars"]
@@ -32,36 +41,38 @@ def process() -> pd.DataFrame:
     result = df[["BodyType", "Make", "GenModel", "Model", "Fuel", latest_q]].copy()
     result.columns = ["body_type", "make", "gen_model", "model", "fuel", "count"]
 
-    # Clean count
-    result["count"] = pd.to_numeric(result["count"], errors="coerce").fillna(0).astype(int)
+    # Clean count (int32 is ample for per-model counts and halves the
+    # bytes moved by the groupbys below)
+    result["count"] = pd.to_numeric(result["count"], errors="coerce").fillna(0).astype("int32")
 
     # Drop zero-count rows
     result = result[result["count"] > 0]
 
-    # Normalise text
-    result["make"] = result["make"].str.strip().str.upper()
-    result["gen_model"] = result["gen_model"].str.strip().str.upper()
-    result["model"] = result["model"].str.strip().str.upper()
-    result["fuel"] = result["fuel"].str.strip().str.upper()
+    # Normalise text with Arrow's utf8 kernels: trim + upper run over the
+    # string buffers in one fused pass per column, instead of two pandas
+    # passes each allocating a fresh object array
+    for col in ["make", "gen_model", "model", "fuel"]:
+        arr = pa.array(result[col], from_pandas=True)
+        result[col] = (pc.utf8_upper(pc.utf8_trim_whitespace(arr))
+                       .to_numpy(zero_copy_only=False))
 
-    # Aggregate to make level for summary
-    make_totals = result.groupby("make")["count"].sum().sort_values(ascending=False)
-    grand_total = make_totals.sum()
+    # The grand total is a plain column sum — no groupby needed for it
+    grand_total = int(result["count"].sum())
 
     # Weight at model level
     result["weight"] = result["count"] / grand_total
 
-    # Also create a make-level summary
+    # Make-level summary: one groupby, already sorted for the print below
+    make_totals = result.groupby("make")["count"].sum().sort_values(ascending=False)
     make_df = make_totals.reset_index()
     make_df.columns = ["make", "count"]
     make_df["weight"] = make_df["count"] / grand_total
-    make_df = make_df.sort_values("count", ascending=False)
 
     print(f"  {grand_total:,.0f} total licensed cars")
     print(f"  {result['make'].nunique()} makes, {len(result)} make/model/fuel combos")
     print(f"  Top 10 makes:")
-    for _, row in make_df.head(10).iterrows():
-        print(f"    {row['make']}: {row['count']:,.0f} ({row['weight']:.1%})")
+    for make, count, weight in make_df.head(10).itertuples(index=False, name=None):
+        print(f"    {make}: {count:,.0f} ({weight:.1%})")
 
     # Fuel type breakdown
     fuel_totals = result.groupby("fuel")["count"].sum().sort_values(ascending=False)
@@ -72,11 +83,11 @@ def process() -> pd.DataFrame:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     out_path = OUT_DIR / "vehicle_make_model.parquet"
-    result.to_parquet(out_path, index=False)
+    write_processed(result, out_path)
     print(f"  Saved: {out_path}")
 
     out_make = OUT_DIR / "vehicle_make_summary.parquet"
-    make_df.to_parquet(out_make, index=False)
+    write_processed(make_df, out_make)
     print(f"  Saved: {out_make}")
 
     return result